@@ -3,6 +3,20 @@ from os import environ
 import click
 import uvicorn
 
+try:
+    import uvloop  # noqa: F401
+
+    LOOP = "uvloop"
+except ImportError:  # uvloop is not available on Windows
+    LOOP = "asyncio"
+
+try:
+    import httptools  # noqa: F401
+
+    HTTP = "httptools"
+except ImportError:
+    HTTP = "h11"
+
 
 @click.command()
 @click.option(
@@ -24,9 +38,18 @@ import uvicorn
     "--workers",
     type=int,
     default=1,
+    envvar="API_WORKERS",
 )
-def main(env: str, host: str, port: int, workers: int) -> None:
-    print(f"Serving on {host}:{port} with {workers} workers in {env} mode.")
+@click.option(
+    "--reload/--no-reload",
+    default=False,
+    help="Restart on code changes. Uvicorn ignores --workers when enabled.",
+)
+def main(env: str, host: str, port: int, workers: int, reload: bool) -> None:
+    print(
+        f"Serving on {host}:{port} with {workers} workers in {env} mode "
+        f"(loop={LOOP}, http={HTTP})."
+    )
     # set environment variable with SERVER_MODE
     environ["UVICORN_SERVER_MODE"] = env
 
@@ -34,10 +57,11 @@ def main(env: str, host: str, port: int, workers: int) -> None:
         app="src.api.main:app",
         host=host,
         port=port,
-        reload=True if env != "production" else False,
+        reload=reload,
         workers=workers,
         log_level="warning" if env == "production" else "info",
-        loop="asyncio",
+        loop=LOOP,
+        http=HTTP,
     )
 
 
@@ -0,0 +1,32 @@
+from time import time
+
+from transformers import pipeline
+
+# load the pipeline once; the same model is baked into the Docker image
+ner = pipeline(
+    "token-classification",
+    model="wietsedv/bert-base-dutch-cased-ner",
+    aggregation_strategy="simple",
+    batch_size=32,
+)
+
+# make example sentences
+sentences = [
+    "Ruben van der Linden ging naar de Lindenlaan in Amsterdam.",
+    "Marieke de Boer werkt bij de gemeente Utrecht.",
+]
+
+# predict all sentences in a single batched call
+t1 = time()
+predictions = ner(sentences)
+t2 = time()
+print(f"Time taken to predict: {t2 - t1:.4f} seconds")
+
+# print predicted NER spans
+print("The following NER tags are found:")
+for sentence, entities in zip(sentences, predictions):
+    print(sentence)
+    for entity in entities:
+        print(
+            f"  {entity['word']} [{entity['entity_group']}] ({entity['score']:.4f})"
+        )
@@ -1,14 +1,27 @@
-import json
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Union
 
+import orjson
 import pikepdf
 import pymupdf
+from lxml import etree
+
+# Same flags page.search_for uses when it builds its own TextPage
+_SEARCH_FLAGS = (
+    pymupdf.TEXT_DEHYPHENATE
+    | pymupdf.TEXT_PRESERVE_WHITESPACE
+    | pymupdf.TEXT_PRESERVE_LIGATURES
+    | pymupdf.TEXT_MEDIABOX_CLIP
+)
+
+_CUSTOM_NS = {"custom": "http://example.com/custom/"}
+# XMP comes from the PDF itself, so never resolve entities or fetch anything
+_XMP_PARSER = etree.XMLParser(resolve_entities=False, no_network=True)
 
 
 def annotate_pdf(
     input_path: str,
     output_path: str,
-    target: str,
+    target: Union[str, List[str]],
     metadata: dict,
     replacement: Optional[str] = None,
 ) -> None:
@@ -17,13 +30,13 @@ def annotate_pdf(
     A step-by-step process:
     1. Open the PDF and optionally redact/replace target text.
     2. Collect locations and metadata for each match.
-    3. Save intermediate PDF.
-    4. Embed collected metadata as JSON in the XMP metadata stream.
+    3. Embed collected metadata as JSON in the XMP metadata stream.
+    4. Save the PDF once.
 
     Args:
         input_path (str): Path to the input PDF file.
         output_path (str): Path to save the annotated PDF.
-        target (str): Text to search for in the PDF.
+        target (Union[str, List[str]]): Text, or list of texts, to search for in the PDF.
         metadata (dict): Metadata to embed in the PDF.
         replacement (Optional[str]): Text to replace the target text with. If None, no replacement is done.
 
@@ -31,42 +44,46 @@ def annotate_pdf(
         None: The function modifies the PDF in place and saves it to `output_path`.
     """
     # Step 1-2: Process with PyMuPDF
+    targets = [target] if isinstance(target, str) else target
     doc = pymupdf.open(input_path)
+    needles = [" ".join(t.split()).lower() for t in targets]
     occurrences = []
     for page_number, page in enumerate(doc, start=1):
-        rects = page.search_for(target)
         page: pymupdf.Page
+        # Build the page's text layout once and search every target in it
+        textpage = page.get_textpage(flags=_SEARCH_FLAGS)
+        # Cheap substring check first; most pages contain none of the targets
+        text = " ".join(textpage.extractText().split()).lower()
+        rects = [
+            r
+            for t, needle in zip(targets, needles)
+            if needle in text
+            for r in page.search_for(t, textpage=textpage)
+        ]
         for r in rects:
+            # First record the original occurrence
+            occurrences.append(
+                {
+                    "page": page_number,
+                    "rect": (r.x0, r.y0, r.x1, r.y1),
+                    "metadata": metadata,
+                }
+            )
             if replacement is not None:
-                # First record the original occurrence
-                occurrences.append(
-                    {
-                        "page": page_number,
-                        "rect": (r.x0, r.y0, r.x1, r.y1),
-                        "metadata": metadata,
-                    }
-                )
-                # Then apply the redaction
+                # Then mark it for redaction
                 page.add_redact_annot(r, fill=(1, 1, 1), text=replacement)
-                page.apply_redactions()  # type: ignore
-            else:
-                # Record occurrence without redacting
-                occurrences.append(
-                    {
-                        "page": page_number,
-                        "rect": (r.x0, r.y0, r.x1, r.y1),
-                        "metadata": metadata,
-                    }
-                )
-    doc.save(output_path, incremental=False)
-
-    # Step 3-4: Embed JSON in XMP with pikepdf
-    with pikepdf.Pdf.open(output_path, allow_overwriting_input=True) as pdf:
-        # Build JSON blob of all occurrences
-        blob = json.dumps({"occurrences": occurrences})
-
-        # Store the data as a CDATA section to avoid XML escaping issues
-        xmp = f"""<?xpacket begin='' id="W5M0MpCehiHzreSzNTczkc9d"?>
+        if replacement is not None and rects:
+            # Rewriting the content stream is expensive; do it once per page and
+            # only for text, the replacement is written by the redaction itself
+            page.apply_redactions(  # type: ignore
+                images=pymupdf.PDF_REDACT_IMAGE_NONE,
+                graphics=pymupdf.PDF_REDACT_LINE_ART_NONE,
+            )
+    # Step 3-4: Embed the occurrences as JSON in the XMP metadata and save once
+    blob = orjson.dumps({"occurrences": occurrences}).decode()
+
+    # Store the data as a CDATA section to avoid XML escaping issues
+    xmp = f"""<?xpacket begin='' id="W5M0MpCehiHzreSzNTczkc9d"?>
 <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
          xmlns:custom="http://example.com/custom/">
   <rdf:Description rdf:about="">
@@ -74,8 +91,9 @@ def annotate_pdf(
   </rdf:Description>
 </rdf:RDF>
 <?xpacket end='w'?>"""
-        pdf.Root.Metadata = pdf.make_stream(xmp.encode("utf-8"))
-        pdf.save(output_path)
+    doc.set_xml_metadata(xmp)
+    doc.save(output_path, garbage=3, deflate=True)
+    doc.close()
 
 
 def extract_annotations(input_path: str) -> Dict[str, Any]:
@@ -93,42 +111,30 @@ def extract_annotations(input_path: str) -> Dict[str, Any]:
     """
     with pikepdf.Pdf.open(input_path) as pdf:
         if "/Metadata" in pdf.Root:
-            xmp_stream = pdf.Root.Metadata.read_bytes().decode("utf-8")
-
-            # Look for the AnnotationData content (not in CDATA anymore)
-            import re
-
-            annotation_pattern = r"<custom:AnnotationData>(.*?)</custom:AnnotationData>"
-            match = re.search(annotation_pattern, xmp_stream, re.DOTALL)
-            if match:
-                json_blob = match.group(1)
-                try:
-                    return dict(json.loads(json_blob))
-                except json.JSONDecodeError as e:
-                    print(f"Failed to parse JSON from CDATA: {e}")
-                    print(f"JSON data: {json_blob[:100]}...")
-
-            # Try alternative pattern (attribute-style)
-            start = xmp_stream.find('custom:AnnotationData="')
-            if start != -1:
-                start += len('custom:AnnotationData="')
-                end = xmp_stream.find('"', start)
-                json_blob = xmp_stream[start:end]
-
-                # Unescape XML entities
-                import xml.sax.saxutils as saxutils
-
-                unescaped_json = saxutils.unescape(json_blob)
-
+            xmp_stream = pdf.Root.Metadata.read_bytes()
+
+            # Element text (with or without CDATA) or the attribute-style variant;
+            # lxml unescapes both
+            try:
+                root = etree.fromstring(xmp_stream, parser=_XMP_PARSER)
+                found = root.xpath(
+                    "//custom:AnnotationData/text() | //@custom:AnnotationData",
+                    namespaces=_CUSTOM_NS,
+                )
+            except etree.XMLSyntaxError as e:
+                print(f"Failed to parse XMP: {e}")
+                found = []
+            if found:
+                json_blob = str(found[0])
                 try:
-                    return dict(json.loads(unescaped_json))
-                except json.JSONDecodeError as e:
+                    return dict(orjson.loads(json_blob))
+                except orjson.JSONDecodeError as e:
                     print(f"Failed to parse JSON: {e}")
-                    print(f"JSON data: {unescaped_json[:100]}...")
+                    print(f"JSON data: {json_blob[:100]}...")
 
             # Debug: Dump the XMP content to see what's actually in there
             print("\nXMP content preview:")
-            print(xmp_stream[:500] + "...")
+            print(xmp_stream[:500].decode("utf-8", errors="replace") + "...")
             print("\n")
             print("Metadata found but AnnotationData not found in XMP")
         else:
@@ -170,7 +176,9 @@ if __name__ == "__main__":
 
         print("Extracting annotations from:", output_pdf)
         data = extract_annotations(output_pdf)
-        print("Extracted data:", json.dumps(data, indent=2))
+        print(
+            "Extracted data:", orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        )
 
     except Exception as e:
         import traceback
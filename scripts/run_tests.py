@@ -5,9 +5,10 @@ Automated test runner for OpenAnonymiser string endpoints.
 This script:
 1. Starts the API locally with `uv run api.py`
 2. Runs comprehensive unit tests for all endpoints
+   (while the Docker image is built in the background)
 3. Generates a test report
 4. Stops the API
-5. Builds Docker container and runs tests
+5. Runs tests against the Docker container
 6. Creates PR to staging if all tests pass
 
 Usage: python run_tests.py
@@ -18,15 +19,22 @@ import time
 import sys
 import os
 import signal
-import psutil
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import json
 from datetime import datetime
 
+import httpx
+
 
 class TestRunner:
     def __init__(self):
         self.api_process = None
+        self.api_output = None
+        # One keep-alive client for every readiness probe and endpoint check
+        self.http = httpx.Client(timeout=5)
         self.test_results = {}
         self.start_time = datetime.now()
 
@@ -40,33 +48,48 @@ class TestRunner:
         self.log("🚀 Starting API locally...")
 
         try:
-            # Start API in background
+            # Start API in background; stderr is merged so uvicorn's log lines
+            # (and the pipe buffer) are consumed by a single reader thread
+            # Own session/process group, so stop_api can signal the whole tree
+            # (uv and the uvicorn workers) without touching this runner
             self.api_process = subprocess.Popen(
                 ["uv", "run", "api.py"],
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
+                start_new_session=sys.platform != "win32",
             )
+            self.api_output = queue.Queue()
+            threading.Thread(target=self._pump_api_output, daemon=True).start()
 
-            # Wait for API to be ready
+            # Wait for uvicorn to report startup, probing /health as a fallback
             self.log("⏳ Waiting for API to start...")
-            max_retries = 30
-            for i in range(max_retries):
+            deadline = time.monotonic() + 60
+            next_probe = time.monotonic()
+            while time.monotonic() < deadline:
                 try:
-                    result = subprocess.run(
-                        ["curl", "-s", "http://localhost:8080/api/v1/health"],
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
-                    )
-                    if result.returncode == 0 and "pong" in result.stdout:
+                    line = self.api_output.get(timeout=0.05)
+                    if "Application startup complete" in line:
                         self.log("✅ API is ready!")
                         return True
-                except subprocess.TimeoutExpired:
+                except queue.Empty:
                     pass
 
-                time.sleep(2)
-                self.log(f"⏳ Retry {i + 1}/{max_retries}...")
+                if self.api_process.poll() is not None:
+                    self.log("❌ API process exited during startup", "ERROR")
+                    return False
+
+                if time.monotonic() >= next_probe:
+                    next_probe = time.monotonic() + 1
+                    try:
+                        response = self.http.get(
+                            "http://localhost:8080/api/v1/health", timeout=1
+                        )
+                        if response.json() == {"ping": "pong"}:
+                            self.log("✅ API is ready!")
+                            return True
+                    except (httpx.HTTPError, ValueError):
+                        pass
 
             self.log("❌ API failed to start within timeout", "ERROR")
             return False
@@ -75,9 +98,14 @@ class TestRunner:
             self.log(f"❌ Failed to start API: {e}", "ERROR")
             return False
 
+    def _pump_api_output(self):
+        """Forward API output lines to a queue until the process exits."""
+        for line in self.api_process.stdout:
+            self.api_output.put(line)
+
     def stop_api(self):
         """Stop the API process."""
-        if self.api_process:
+        if self.api_process and self.api_process.poll() is None:
             self.log("🛑 Stopping API...")
             try:
                 # Terminate the process group
@@ -87,7 +115,8 @@ class TestRunner:
                         capture_output=True,
                     )
                 else:
-                    os.killpg(os.getpgid(self.api_process.pid), signal.SIGTERM)
+                    # The API leads its own session, so its pid is the group id
+                    os.killpg(self.api_process.pid, signal.SIGTERM)
 
                 # Wait for process to terminate
                 self.api_process.wait(timeout=10)
@@ -95,9 +124,13 @@ class TestRunner:
 
             except subprocess.TimeoutExpired:
                 self.log("⚠️ Force killing API process", "WARNING")
-                self.api_process.kill()
+                if sys.platform == "win32":
+                    self.api_process.kill()
+                else:
+                    os.killpg(self.api_process.pid, signal.SIGKILL)
             except Exception as e:
                 self.log(f"⚠️ Error stopping API: {e}", "WARNING")
+        self.api_process = None
 
     def run_unit_tests(self):
         """Run the pytest test suite."""
@@ -150,10 +183,22 @@ class TestRunner:
         self.log("🐳 Building Docker image...")
 
         try:
+            # BuildKit with inline cache lets the next run reuse this image's layers
             result = subprocess.run(
-                ["docker", "build", "-t", "openanonymiser:test-string-endpoints", "."],
+                [
+                    "docker",
+                    "build",
+                    "--build-arg",
+                    "BUILDKIT_INLINE_CACHE=1",
+                    "--cache-from",
+                    "openanonymiser:test-string-endpoints",
+                    "-t",
+                    "openanonymiser:test-string-endpoints",
+                    ".",
+                ],
                 capture_output=True,
                 text=True,
+                env={**os.environ, "DOCKER_BUILDKIT": "1"},
             )
 
             self.test_results["docker_build"] = {
@@ -214,19 +259,12 @@ class TestRunner:
 
             for i in range(max_retries):
                 try:
-                    result = subprocess.run(
-                        ["curl", "-s", "http://localhost:8081/api/v1/health"],
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
-                    )
-
-                    if result.returncode == 0 and "pong" in result.stdout:
+                    response = self.http.get("http://localhost:8081/api/v1/health")
+                    if response.json() == {"ping": "pong"}:
                         self.log("✅ Container is ready!")
                         container_ready = True
                         break
-
-                except subprocess.TimeoutExpired:
+                except (httpx.HTTPError, ValueError):
                     pass
 
                 time.sleep(3)
@@ -247,40 +285,25 @@ class TestRunner:
             tests_passed = True
 
             # Test health endpoint
-            result = subprocess.run(
-                ["curl", "-s", "http://localhost:8081/api/v1/health"],
-                capture_output=True,
-                text=True,
-            )
-
-            if '{"ping":"pong"}' not in result.stdout:
+            response = self.http.get("http://localhost:8081/api/v1/health")
+            if response.status_code != 200 or response.json() != {"ping": "pong"}:
                 self.log("❌ Container health check failed", "ERROR")
                 tests_passed = False
             else:
                 self.log("✅ Container health check passed")
 
             # Test analyze endpoint
-            result = subprocess.run(
-                [
-                    "curl",
-                    "-s",
-                    "-X",
-                    "POST",
-                    "http://localhost:8081/api/v1/analyze",
-                    "-H",
-                    "Content-Type: application/json",
-                    "-d",
-                    '{"text": "Jan woont in Amsterdam", "language": "nl"}',
-                ],
-                capture_output=True,
-                text=True,
+            response = self.http.post(
+                "http://localhost:8081/api/v1/analyze",
+                json={"text": "Jan woont in Amsterdam", "language": "nl"},
+                timeout=30,
             )
-
-            if '"pii_entities"' in result.stdout and '"text_length"' in result.stdout:
+            data = response.json() if response.status_code == 200 else {}
+            if "pii_entities" in data and "text_length" in data:
                 self.log("✅ Container analyze endpoint passed")
             else:
                 self.log("❌ Container analyze endpoint failed", "ERROR")
-                self.log(f"Response: {result.stdout}")
+                self.log(f"Response: {response.text}")
                 tests_passed = False
 
             self.test_results["docker_tests"] = {
@@ -481,20 +504,23 @@ class TestRunner:
         try:
             self.log("🎯 Starting complete test suite...")
 
-            # Step 1: Start API locally and run unit tests
+            # Step 1: Start API locally and run unit tests while the Docker
+            # image builds in the background (the build doesn't need the tests)
             if not self.start_api():
                 return False
 
-            try:
-                if not self.run_unit_tests():
-                    return False
-            finally:
-                self.stop_api()
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                docker_build = executor.submit(self.build_docker_image)
+                try:
+                    unit_tests_passed = self.run_unit_tests()
+                finally:
+                    self.stop_api()
+                docker_built = docker_build.result()
 
-            # Step 2: Build and test Docker container
-            if not self.build_docker_image():
+            if not unit_tests_passed or not docker_built:
                 return False
 
+            # Step 2: Test Docker container
             if not self.test_docker_container():
                 return False
 
@@ -517,6 +543,7 @@ class TestRunner:
         finally:
             # Cleanup
             self.stop_api()
+            self.http.close()
 
 
 if __name__ == "__main__":
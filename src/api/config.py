@@ -1,5 +1,9 @@
+import atexit
 import logging.config
+import logging.handlers
 import os
+import queue
+from typing import Optional
 
 from dotenv import load_dotenv
 
@@ -10,9 +14,13 @@ class Settings:
     """Applicatieconfiguratie voor de Presidio-NL API.
 
     Bevat standaardwaarden voor debugmodus, ondersteunde entiteiten, taal,
-    en de te gebruiken NLP-modellen (spaCy of transformers).
+    en de te gebruiken NLP-modellen (spaCy of transformers). Alle waarden
+    worden één keer bij het importeren uit de omgeving gelezen; de instantie
+    heeft geen eigen `__dict__`, dus per ongeluk overschrijven geeft een fout.
     """
 
+    __slots__ = ()
+
     DEBUG: bool = os.getenv("DEBUG", "true").lower() == "true"
     DEFAULT_ENTITIES = [
         "PERSON",
@@ -24,6 +32,8 @@ class Settings:
         "DATE_TIME",
         "ADDRESS",
     ]
+    # Zelfde entities als set voor O(1) membership checks; de lijst houdt de volgorde
+    DEFAULT_ENTITY_SET = frozenset(DEFAULT_ENTITIES)
 
     DEFAULT_LANGUAGE = os.getenv("DEFAULT_LANGUAGE", "nl")
     DEFAULT_NLP_ENGINE = os.getenv("DEFAULT_NLP_ENGINE", "spacy").lower()
@@ -31,6 +41,36 @@ class Settings:
     DEFAULT_TRANSFORMERS_MODEL = os.getenv(
         "DEFAULT_TRANSFORMERS_MODEL", "pdelobelle/robbert-v2-dutch-base"
     )
+    # Draai SpaCy en transformers op de GPU (vereist CUDA, bijv. spacy[cuda12x])
+    USE_GPU: bool = os.getenv("USE_GPU", "false").lower() == "true"
+    # "int8" kwantiseert het transformers-model dynamisch voor snellere CPU-inferentie,
+    # "fp16" draait het op de GPU in halve precisie
+    TRANSFORMERS_QUANTIZE = os.getenv("TRANSFORMERS_QUANTIZE") or None
+    # Pipeline-componenten die voor NER niet nodig zijn; ze worden niet eens
+    # geladen, wat ook geheugen per worker scheelt
+    SPACY_DISABLED_COMPONENTS = [
+        c.strip()
+        for c in os.getenv(
+            "SPACY_DISABLED_COMPONENTS",
+            "parser,tagger,morphologizer,lemmatizer,attribute_ruler",
+        ).split(",")
+        if c.strip()
+    ]
+    # Aantal teksten dat in één keer door de NLP-pipeline gaat bij batch-analyse
+    NLP_BATCH_SIZE = int(os.getenv("NLP_BATCH_SIZE", "32"))
+    # Zo lang (ms) wacht het transformers-model op gelijktijdige aanvragen om ze
+    # in één batch te verwerken (0 = elke aanvraag direct apart)
+    NLP_BATCH_WAIT_MS = float(os.getenv("NLP_BATCH_WAIT_MS", "0"))
+    # Langere teksten worden in stukken van maximaal deze lengte geanalyseerd
+    NLP_MAX_CHUNK_CHARS = int(os.getenv("NLP_MAX_CHUNK_CHARS", "20000"))
+    # Maximaal aantal teksten per aanvraag op /analyze/batch
+    MAX_BATCH_TEXTS = int(os.getenv("MAX_BATCH_TEXTS", "100"))
+    # Aantal processen voor nlp.pipe; elk proces laadt een eigen kopie van het model
+    NLP_N_PROCESS = int(os.getenv("NLP_N_PROCESS", "1"))
+    # Aantal threads dat tegelijk NER draait, per proces
+    NLP_WORKERS = int(os.getenv("NLP_WORKERS", "2"))
+    # Aantal analyseresultaten dat in het geheugen wordt bewaard (0 = uit)
+    ANALYSIS_CACHE_SIZE = int(os.getenv("ANALYSIS_CACHE_SIZE", "4096"))
     ALLOWED_ORIGINS = ["*"]
     SUPPORTED_UPLOAD_EXTENSIONS = [
         "pdf",
@@ -45,15 +85,12 @@ class Settings:
         "DATE_TIME",
         "ADDRESS",
     ]
-    key = os.getenv("CRYPTO_KEY")
-    if key:
-        CRYPTO_KEY = key.encode("utf-8")
-    else:
-        logging.warning(
-            "CRYPTO_KEY is not set. Using default value. This is not secure for production!"
-        )
-        CRYPTO_KEY = b"secret"
+    SUPPORTED_PII_ENTITY_SET = frozenset(SUPPORTED_PII_ENTITIES_TO_ANONYMIZE)
+    CRYPTO_KEY_IS_DEFAULT: bool = not os.getenv("CRYPTO_KEY")
+    CRYPTO_KEY: bytes = (os.getenv("CRYPTO_KEY") or "secret").encode("utf-8")
     DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./data/openanonymiser.db")
+    # Poolgrootte voor server-databases zoals PostgreSQL (niet gebruikt voor SQLite)
+    DATABASE_POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", "10"))
     KEEP_TEMP_FILES = os.getenv("KEEP_TEMP_FILES", "false").lower() == "true"
 
     # Base directory for data files (used by temp directories)
@@ -65,41 +102,70 @@ class Settings:
 
 settings: Settings = Settings()
 
+_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_log_listener() -> None:
+    # Schrijft de records die nog in de queue staan weg voordat het proces stopt
+    if _log_listener is not None:
+        _log_listener.stop()
+
 
 def setup_logging() -> None:
     """Configureer logging voor de applicatie.
 
     Stelt zowel een file- als streamhandler in, met DEBUG- of INFO-niveau
     afhankelijk van de configuratie. Logt naar 'app.log' en de console.
+    Het schrijven naar 'app.log' gebeurt in een aparte thread: een logregel
+    op het request-pad zet alleen een record in een queue.
+
+    Alle uvicorn-workers schrijven naar hetzelfde bestand. Roteren vanuit het
+    proces kan dan niet (elke worker zou het bestand zelf hernoemen), dus het
+    bestand wordt alleen aangevuld; roteer het extern, bijvoorbeeld met
+    logrotate. De handler opent het bestand opnieuw zodra het verplaatst is.
     """
-    console_log_level = "DEBUG" if settings.DEBUG else "INFO"
+    global _log_listener
+    log_level = "DEBUG" if settings.DEBUG else "INFO"
     log_dir = os.getenv("LOG_DIR", "logs")
     os.makedirs(log_dir, exist_ok=True)
+
+    file_handler = logging.handlers.WatchedFileHandler(
+        os.path.join(log_dir, "app.log"), encoding="utf-8"
+    )
+    file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+    log_queue: queue.Queue = queue.Queue()
+    if _log_listener is None:
+        atexit.register(_stop_log_listener)
+    else:
+        _log_listener.stop()
+    _log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+    _log_listener.start()
+
     logging.config.dictConfig(
         {
             "version": 1,
             "disable_existing_loggers": False,
             "formatters": {
                 "default": {
-                    "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+                    "format": _LOG_FORMAT,
                 },
             },
             "handlers": {
                 "file": {
-                    "class": "logging.FileHandler",
-                    "formatter": "default",
-                    "level": "DEBUG",
-                    "filename": os.path.join(log_dir, "app.log"),
+                    "()": logging.handlers.QueueHandler,
+                    "queue": log_queue,
                 },
                 "stream": {
                     "class": "logging.StreamHandler",
                     "formatter": "default",
-                    "level": console_log_level,
+                    "level": log_level,
                     "stream": "ext://sys.stdout",  # Use stdout with UTF-8 encoding
                 },
             },
             "root": {
-                "level": "DEBUG",
+                # In productie worden DEBUG-records niet eens aangemaakt
+                "level": log_level,
                 "handlers": ["file", "stream"],
             },
             "loggers": {
@@ -114,3 +180,7 @@ def setup_logging() -> None:
     )
 
     logging.debug("Logging is configured.")
+    if settings.CRYPTO_KEY_IS_DEFAULT:
+        logging.warning(
+            "CRYPTO_KEY is not set. Using default value. This is not secure for production!"
+        )
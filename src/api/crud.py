@@ -1,7 +1,13 @@
-from typing import Any, Optional, Protocol, TypeVar, Union, overload
-
-from sqlalchemy import UnaryExpression
-from sqlalchemy.orm import InstrumentedAttribute, Mapped, Session
+from typing import Any, Iterator, Optional, Protocol, TypeVar, Union, overload
+
+from sqlalchemy import UnaryExpression, delete, select
+from sqlalchemy.orm import (
+    InstrumentedAttribute,
+    Mapped,
+    Session,
+    joinedload,
+    raiseload,
+)
 
 from src.api.database import (
     AnonymizationEvent,
@@ -28,6 +34,9 @@ class BaseWithUuid(Protocol):
     id: Mapped[str]
 
 
+# Stay below SQLite's default SQLITE_MAX_VARIABLE_NUMBER for IN (...) lookups
+_MAX_IN_PARAMS = 900
+
 Entity = TypeVar("Entity", bound=Base)
 EntityWithId = TypeVar("EntityWithId", bound=BaseWithId)
 EntityWithUuid = TypeVar("EntityWithUuid", bound=BaseWithUuid)
@@ -36,13 +45,14 @@ EntityWithUuid = TypeVar("EntityWithUuid", bound=BaseWithUuid)
 def get_entity(
     db: Session, entity: type[EntityWithId], id: int
 ) -> Optional[EntityWithId]:
-    return db.query(entity).filter(entity.id == id).first()
+    # Primary-key lookup: served from the identity map when already loaded
+    return db.get(entity, id)
 
 
 def get_entity_uuid(
     db: Session, entity: type[EntityWithUuid], uuid: str
 ) -> Optional[EntityWithUuid]:
-    return db.query(entity).filter(entity.id == uuid).first()
+    return db.get(entity, uuid)
 
 
 def get_entity_by_field(
@@ -51,7 +61,7 @@ def get_entity_by_field(
     field: InstrumentedAttribute[Any],
     value: Union[str, int, bool],
 ) -> Optional[Entity]:
-    return db.query(entity).filter(field == value).first()
+    return db.scalars(select(entity).where(field == value).limit(1)).first()
 
 
 def get_entity_by_field_in(
@@ -59,12 +69,33 @@ def get_entity_by_field_in(
     entity: type[Entity],
     field: InstrumentedAttribute[Any],
     value: list[str | int | bool],
-) -> list[Entity]:
-    return db.query(entity).filter(field.in_(value)).all()
+) -> Iterator[Entity]:
+    # Stream rows in batches instead of materializing the full result at once
+    value = list(dict.fromkeys(value))
+    for start in range(0, len(value), _MAX_IN_PARAMS):
+        chunk = value[start : start + _MAX_IN_PARAMS]
+        yield from db.scalars(
+            select(entity).where(field.in_(chunk)).execution_options(yield_per=1000)
+        )
+
+
+def get_ids_by_field_in(
+    db: Session,
+    entity: type[EntityWithUuid],
+    field: InstrumentedAttribute[Any],
+    value: list[str | int | bool],
+) -> list[str]:
+    # Selects only the primary key, so no ORM objects are constructed
+    ids: list[str] = []
+    value = list(dict.fromkeys(value))
+    for start in range(0, len(value), _MAX_IN_PARAMS):
+        chunk = value[start : start + _MAX_IN_PARAMS]
+        ids.extend(db.scalars(select(entity.id).where(field.in_(chunk))))
+    return ids
 
 
 def get_entities(db: Session, entity: type[Entity]) -> list[Entity]:
-    return db.query(entity).all()
+    return list(db.scalars(select(entity)))
 
 
 def get_entities_by_field(
@@ -73,7 +104,7 @@ def get_entities_by_field(
     field: InstrumentedAttribute[Any],
     value: Union[str, int, bool],
 ) -> list[Entity]:
-    return db.query(entity).filter(field == value).all()
+    return list(db.scalars(select(entity).where(field == value)))
 
 
 def get_entites_by_field_paged(
@@ -85,13 +116,14 @@ def get_entites_by_field_paged(
     offset: int,
     sort: UnaryExpression[Any],
 ) -> list[Entity]:
-    return (
-        db.query(entity)
-        .filter(field == value)
-        .order_by(sort)
-        .limit(limit)
-        .offset(offset)
-        .all()
+    return list(
+        db.scalars(
+            select(entity)
+            .where(field == value)
+            .order_by(sort)
+            .limit(limit)
+            .offset(offset)
+        )
     )
 
 
@@ -106,12 +138,12 @@ async def delete_entity(db: Session, entity: type[EntityWithId], id: int) -> Non
 async def delete_entity(
     db: Session, entity: type[EntityWithUuid | EntityWithId], id: str | int
 ) -> None:
-    db.query(entity).filter(entity.id == id).delete()
+    db.execute(delete(entity).where(entity.id == id))
     await commit_session(db)
 
 
 async def delete_entities(db: Session, entity: type[Entity]) -> None:
-    db.query(entity).delete()
+    db.execute(delete(entity))
     await commit_session(db)
 
 
@@ -123,9 +155,15 @@ def create_document(
     content_type: str,
     source_path: str,
     anonymized_path: Optional[str] = None,
-    pii_entities: Optional[str] = None,
+    pii_entities: Optional[list[dict[str, Any]]] = None,
+    *,
+    commit: bool = True,
 ) -> Document:
-    """Create a new document."""
+    """Create a new document.
+
+    With ``commit=False`` the document is only added to the session, so that
+    several writes can share one transaction (and one fsync).
+    """
     db_document = Document(
         id=id,
         filename=filename,
@@ -135,45 +173,72 @@ def create_document(
         pii_entities=pii_entities,
     )
     db.add(db_document)
-    db.commit()
-    db.refresh(db_document)
+    if commit:
+        db.commit()
+        db.refresh(db_document)
     return db_document
 
 
-def create_tag(db: Session, id: str, name: str, document_id: str) -> Tag:
-    """Create a new tag."""
+def create_tag(
+    db: Session, id: str, name: str, document_id: str, *, commit: bool = True
+) -> Tag:
+    """Create a new tag; see `create_document` for ``commit``."""
     tag = Tag(id=id, name=name, document_id=document_id)
     db.add(tag)
-    db.commit()
-    db.refresh(tag)
+    if commit:
+        db.commit()
+        db.refresh(tag)
     return tag
 
 
 def create_anonymization_event(
-    db: Session, document_id: str, time_taken: int, status: str
+    db: Session,
+    document_id: str,
+    time_taken: int,
+    status: str,
+    pii_entities: Optional[list[dict[str, str]]] = None,
+    *,
+    commit: bool = True,
 ) -> AnonymizationEvent:
-    """Create a new anonymization event."""
+    """Create a new anonymization event; see `create_document` for ``commit``."""
     event = AnonymizationEvent(
-        document_id=document_id, time_taken=time_taken, status=status
+        document_id=document_id,
+        time_taken=time_taken,
+        status=status,
+        pii_entities=pii_entities,
     )
     db.add(event)
-    db.commit()
-    db.refresh(event)
+    if commit:
+        db.commit()
+        db.refresh(event)
     return event
 
 
 def update_document_anonymized_path(
-    db: Session, document_id: str, anonymized_path: str
+    db: Session, document_id: str, anonymized_path: str, *, commit: bool = True
 ) -> Optional[Document]:
-    """Update the anonymized path of a document."""
-    document = db.query(Document).filter(Document.id == document_id).first()
+    """Update the anonymized path of a document; see `create_document` for ``commit``."""
+    document = db.get(Document, document_id)
     if document:
         document.anonymized_path = anonymized_path
-        db.commit()
-        db.refresh(document)
+        if commit:
+            db.commit()
+            db.refresh(document)
     return document
 
 
-def get_document(db: Session, document_id: str) -> Optional[Document]:
-    """Get a document by ID."""
-    return db.query(Document).filter(Document.id == document_id).first()
+def get_document(
+    db: Session, document_id: str, *, with_tags: bool = False
+) -> Optional[Document]:
+    """Get a document by ID.
+
+    With ``with_tags`` the tags are loaded in the same query, and any other
+    relationship access on the document raises instead of lazily querying.
+    """
+    if not with_tags:
+        return db.get(Document, document_id)
+    return db.get(
+        Document,
+        document_id,
+        options=[joinedload(Document.tags), raiseload("*")],
+    )
@@ -1,7 +1,8 @@
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
-from sqlalchemy import ForeignKey, String, Text, JSON, func
+from sqlalchemy import ForeignKey, Index, String, Text, JSON, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import (
     DeclarativeBase,
     Mapped,
@@ -10,8 +11,14 @@ from sqlalchemy.orm import (
 )
 
 
+# JSON is (de)serialized by the engine; stored as TEXT on SQLite, JSONB on Postgres
+_PiiEntitiesJSON = JSON(none_as_null=True).with_variant(
+    JSONB(none_as_null=True), "postgresql"
+)
+
+
 class Base(DeclarativeBase):
-    __allow_unmapped__ = True
+    pass
 
 
 class Document(Base):
@@ -25,9 +32,9 @@ class Document(Base):
     uploaded_at: Mapped[datetime] = mapped_column(server_default=func.now())
     source_path: Mapped[str] = mapped_column(Text, nullable=False)
     anonymized_path: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    pii_entities: Mapped[Optional[str]] = mapped_column(
-        Text, nullable=True
-    )  # Store as JSON string
+    pii_entities: Mapped[Optional[List[Dict[str, Any]]]] = mapped_column(
+        _PiiEntitiesJSON, nullable=True
+    )
 
     # Relationships
     tags: Mapped[List["Tag"]] = relationship(
@@ -37,14 +44,14 @@ class Document(Base):
         back_populates="document", cascade="all, delete-orphan"
     )
 
-    # Store entities as JSON in memory (not in database) - DEPRECATED: use pii_entities field instead
-    _entities: Optional[List[Dict[str, str]]] = None
-
 
 class Tag(Base):
     """Tag model based on the ERD."""
 
     __tablename__ = "tags"
+    # Tags are always looked up per document; with the name in the index the
+    # tag list of a document is read from the index alone
+    __table_args__ = (Index("ix_tags_document_id_name", "document_id", "name"),)
 
     id: Mapped[str] = mapped_column(String(32), primary_key=True)
     document_id: Mapped[str] = mapped_column(String(32), ForeignKey("documents.id"))
@@ -60,21 +67,16 @@ class AnonymizationEvent(Base):
     __tablename__ = "anonymization_events"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    document_id: Mapped[str] = mapped_column(String(32), ForeignKey("documents.id"))
+    document_id: Mapped[str] = mapped_column(
+        String(32), ForeignKey("documents.id"), index=True
+    )
     anonymized_at: Mapped[datetime] = mapped_column(server_default=func.now())
     time_taken: Mapped[int] = mapped_column(nullable=False)  # Seconds
     status: Mapped[str] = mapped_column(Text, nullable=False)
+    # The entities selected for anonymization
+    pii_entities: Mapped[Optional[List[Dict[str, str]]]] = mapped_column(
+        _PiiEntitiesJSON, nullable=True
+    )
 
     # Relationship
     document: Mapped["Document"] = relationship(back_populates="anonymization_events")
-
-    # Store PII entities as JSON in memory (not in database)
-    _pii_entities: Optional[List[Dict[str, str]]] = None
-
-    @property
-    def pii_entities(self) -> Optional[List[Dict[str, str]]]:
-        return self._pii_entities
-
-    @pii_entities.setter
-    def pii_entities(self, value: List[Dict[str, str]]) -> None:
-        self._pii_entities = value
@@ -1,28 +1,117 @@
 import os
 import secrets
-from typing import Annotated, Generator
+from typing import Annotated, Any, Awaitable, Callable, Generator, TypeVar
 
-from fastapi import Depends, HTTPException, status
+import orjson
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
-from sqlalchemy import create_engine
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import create_engine, event, inspect, make_url, text
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import (
     Session,
     sessionmaker,
 )
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateColumn, CreateIndex, CreateTable
 
 from src.api.config import settings
 from src.api.database import Base
+from src.api.services.text_analyzer import ModularTextAnalyzer
 
 # Ensure data directory exists before creating database
 os.makedirs(settings.DATA_DIR, exist_ok=True)
 
 # Define the database engine and session
-engine = create_engine(settings.DATABASE_URL, connect_args={"check_same_thread": False})
+database_url = make_url(settings.DATABASE_URL)
+engine_options: dict[str, Any]
+if database_url.get_backend_name() == "sqlite":
+    engine_options = {"connect_args": {"check_same_thread": False}}
+    if database_url.database in (None, "", ":memory:"):
+        # Every connection to :memory: is a new, empty database
+        engine_options["poolclass"] = StaticPool
+else:
+    engine_options = {
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_POOL_SIZE,
+        # Replace connections the server closed while they sat in the pool
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+engine = create_engine(
+    database_url,
+    # JSON columns are encoded and decoded with orjson instead of the json module;
+    # transformers scores in stored entities are numpy floats
+    json_serializer=lambda value: orjson.dumps(
+        value, option=orjson.OPT_SERIALIZE_NUMPY
+    ).decode(),
+    json_deserializer=orjson.loads,
+    **engine_options,
+)
+
+if engine.dialect.name == "sqlite":
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        # WAL with synchronous=NORMAL only fsyncs at checkpoints instead of
+        # on every commit, and lets readers run alongside a writer
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        # Keep temp tables in memory, memory-map up to 256MB of the file and
+        # allow a 64MB page cache per connection
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA cache_size=-65536")
+        cursor.close()
+
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base.metadata.create_all(bind=engine, checkfirst=True)
+
+
+def _upgrade_schema() -> None:
+    """Create missing tables, and add nullable columns and indexes added later.
+
+    Every uvicorn worker imports this module, so two processes can run this
+    at the same time. Each statement tolerates the other worker having
+    already applied it.
+    """
+    for table in Base.metadata.sorted_tables:
+        with engine.begin() as connection:
+            connection.execute(CreateTable(table, if_not_exists=True))
+        existing_columns = {c["name"] for c in inspect(engine).get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing_columns or not column.nullable:
+                continue
+            column_ddl = CreateColumn(column).compile(dialect=engine.dialect)
+            try:
+                with engine.begin() as connection:
+                    connection.execute(
+                        text(f"ALTER TABLE {table.name} ADD COLUMN {column_ddl}")
+                    )
+            except DBAPIError:
+                # SQLite has no ADD COLUMN IF NOT EXISTS; only fail when the
+                # column is still missing, i.e. no other worker added it
+                current = {c["name"] for c in inspect(engine).get_columns(table.name)}
+                if column.name not in current:
+                    raise
+        for index in table.indexes:
+            # IF NOT EXISTS instead of checkfirst: another worker may create the
+            # index between the check and the CREATE
+            with engine.begin() as connection:
+                connection.execute(CreateIndex(index, if_not_exists=True))
+
+
+_upgrade_schema()
+
+RequestModel = TypeVar("RequestModel", bound=BaseModel)
 
 # SEcurity stuff
 security = HTTPBasic()
+# The expected credentials never change, so encode them once
+_CORRECT_USERNAME_BYTES = settings.BASIC_AUTH_USERNAME.encode("utf8")
+_CORRECT_PASSWORD_BYTES = settings.BASIC_AUTH_PASSWORD.encode("utf8")
 
 
 def get_user(
@@ -44,16 +133,15 @@ def get_user(
         str: The username of the authenticated user.
     """
     current_username_bytes = credentials.username.encode("utf8")
-    correct_username_bytes = settings.BASIC_AUTH_USERNAME.encode("utf8")
+    current_password_bytes = credentials.password.encode("utf8")
     is_correct_username = secrets.compare_digest(
-        current_username_bytes, correct_username_bytes
+        current_username_bytes, _CORRECT_USERNAME_BYTES
     )
-    current_password_bytes = credentials.password.encode("utf8")
-    correct_password_bytes = settings.BASIC_AUTH_PASSWORD.encode("utf8")
     is_correct_password = secrets.compare_digest(
-        current_password_bytes, correct_password_bytes
+        current_password_bytes, _CORRECT_PASSWORD_BYTES
     )
-    if not (is_correct_username and is_correct_password):
+    # Combine with & so there is no short-circuit branch on the username result
+    if not (is_correct_username & is_correct_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -69,3 +157,62 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+def get_analyzer(request: Request) -> ModularTextAnalyzer:
+    """Get the analyzer that was loaded during application startup.
+
+    Falls back to building it on first use when the lifespan did not run,
+    e.g. for a ``TestClient`` that is not used as a context manager.
+    """
+    analyzer = getattr(request.app.state, "analyzer", None)
+    if analyzer is None:
+        analyzer = request.app.state.analyzer = ModularTextAnalyzer.get()
+    return analyzer
+
+
+def json_body(
+    model: type[RequestModel],
+) -> Callable[[Request], Awaitable[RequestModel]]:
+    """Build a dependency that validates the raw JSON body as ``model``.
+
+    pydantic-core parses and validates the bytes in one pass, instead of
+    FastAPI decoding the body to a dict with ``json.loads`` first. Errors are
+    raised as a ``RequestValidationError`` so clients still get the usual 422.
+    Pair it with ``openapi_extra=json_body_openapi(model)`` on the route.
+    """
+
+    async def parse(request: Request) -> RequestModel:
+        body = await request.body()
+        if not body:
+            raise RequestValidationError(
+                [
+                    {
+                        "type": "missing",
+                        "loc": ("body",),
+                        "msg": "Field required",
+                        "input": None,
+                    }
+                ]
+            )
+        try:
+            return model.model_validate_json(body)
+        except ValidationError as e:
+            raise RequestValidationError(
+                [
+                    {**error, "loc": ("body", *error["loc"])}
+                    for error in e.errors(include_url=False)
+                ]
+            ) from e
+
+    return parse
+
+
+def json_body_openapi(model: type[BaseModel]) -> dict[str, Any]:
+    """OpenAPI request body for routes that read their body via ``json_body``."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
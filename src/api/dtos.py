@@ -1,10 +1,13 @@
 from datetime import datetime
-from typing import Optional, Union
+from typing import Literal, Optional, Union
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 
 from src.api.config import settings
 
+# Constant half of the "unsupported entities" error messages
+_SUPPORTED_ENTITIES_MSG = ", ".join(settings.SUPPORTED_PII_ENTITIES_TO_ANONYMIZE)
+
 
 class DocumentTagDto(BaseModel):
     id: str
@@ -37,15 +40,15 @@ class DocumentAnonymizationRequest(BaseModel):
     @field_validator("pii_entities_to_anonymize")
     def validate_pii_entities(cls, value: list[str]) -> list[str]:
         """Check if the PII entities are in list settings.SUPPORTED_PII_ENTITIES_TO_ANONYMIZE."""
-        unsupported_entities = [
-            entity
-            for entity in value
-            if entity not in settings.SUPPORTED_PII_ENTITIES_TO_ANONYMIZE
-        ]
-        if unsupported_entities:
+        if not settings.SUPPORTED_PII_ENTITY_SET.issuperset(value):
+            unsupported_entities = [
+                entity
+                for entity in value
+                if entity not in settings.SUPPORTED_PII_ENTITY_SET
+            ]
             raise ValueError(
                 f"Unsupported PII entities: {', '.join(unsupported_entities)}. "
-                f"Supported entities are: {', '.join(settings.SUPPORTED_PII_ENTITIES_TO_ANONYMIZE)}"
+                f"Supported entities are: {_SUPPORTED_ENTITIES_MSG}"
             )
         return value
 
@@ -63,6 +66,25 @@ class DocumentAnonymizationResponse(BaseModel):
 
 # ===== STRING-BASED ENDPOINT DTOs =====
 
+# Checked by pydantic-core itself, without a Python validator per request
+SupportedLanguage = Literal["nl", "en"]  # Extend as needed
+AnonymizationStrategy = Literal["replace", "mask", "redact", "hash"]
+
+
+def _validate_entities(value: Optional[list[str]]) -> Optional[list[str]]:
+    """Check the optional entity filter of the string-based requests."""
+    if value is not None and not settings.SUPPORTED_PII_ENTITY_SET.issuperset(value):
+        unsupported_entities = [
+            entity
+            for entity in value
+            if entity not in settings.SUPPORTED_PII_ENTITY_SET
+        ]
+        raise ValueError(
+            f"Unsupported entities: {', '.join(unsupported_entities)}. "
+            f"Supported: {_SUPPORTED_ENTITIES_MSG}"
+        )
+    return value
+
 
 class PIIEntity(BaseModel):
     """PII Entity with optional score and position info (model-dependent)."""
@@ -80,7 +102,7 @@ class AnalyzeTextRequest(BaseModel):
     """Request DTO for POST /api/v1/analyze endpoint."""
 
     text: str
-    language: str = settings.DEFAULT_LANGUAGE
+    language: SupportedLanguage = settings.DEFAULT_LANGUAGE  # type: ignore[assignment]
     entities: Optional[list[str]] = None  # Filter specific entity types
     nlp_engine: Optional[str] = None  # Override default engine
 
@@ -91,31 +113,10 @@ class AnalyzeTextRequest(BaseModel):
             raise ValueError("Text cannot be empty")
         return value.strip()
 
-    @field_validator("language")
-    def validate_language(cls, value: str) -> str:
-        """Validate language code."""
-        supported_languages = ["nl", "en"]  # Extend as needed
-        if value not in supported_languages:
-            raise ValueError(
-                f"Unsupported language: {value}. Supported: {', '.join(supported_languages)}"
-            )
-        return value
-
     @field_validator("entities")
     def validate_entities(cls, value: Optional[list[str]]) -> Optional[list[str]]:
         """Validate entity types if provided."""
-        if value is not None:
-            unsupported_entities = [
-                entity
-                for entity in value
-                if entity not in settings.SUPPORTED_PII_ENTITIES_TO_ANONYMIZE
-            ]
-            if unsupported_entities:
-                raise ValueError(
-                    f"Unsupported entities: {', '.join(unsupported_entities)}. "
-                    f"Supported: {', '.join(settings.SUPPORTED_PII_ENTITIES_TO_ANONYMIZE)}"
-                )
-        return value
+        return _validate_entities(value)
 
 
 class AnalyzeTextResponse(BaseModel):
@@ -127,14 +128,45 @@ class AnalyzeTextResponse(BaseModel):
     nlp_engine_used: Optional[str] = None
 
 
+class AnalyzeTextBatchRequest(BaseModel):
+    """Request DTO for POST /api/v1/analyze/batch endpoint."""
+
+    texts: list[str] = Field(max_length=settings.MAX_BATCH_TEXTS)
+    language: SupportedLanguage = settings.DEFAULT_LANGUAGE  # type: ignore[assignment]
+    entities: Optional[list[str]] = None  # Filter specific entity types
+    nlp_engine: Optional[str] = None  # Override default engine
+
+    @field_validator("texts")
+    def validate_texts_not_empty(cls, value: list[str]) -> list[str]:
+        """Ensure there is at least one text and none of them are empty."""
+        if not value:
+            raise ValueError("Texts cannot be empty")
+        if any(not text or not text.strip() for text in value):
+            raise ValueError("Text cannot be empty")
+        return [text.strip() for text in value]
+
+    @field_validator("entities")
+    def validate_entities(cls, value: Optional[list[str]]) -> Optional[list[str]]:
+        """Validate entity types if provided."""
+        return _validate_entities(value)
+
+
+class AnalyzeTextBatchResponse(BaseModel):
+    """Response DTO for POST /api/v1/analyze/batch endpoint."""
+
+    results: list[AnalyzeTextResponse]
+    processing_time_ms: Optional[int] = None
+    nlp_engine_used: Optional[str] = None
+
+
 class AnonymizeTextRequest(BaseModel):
     """Request DTO for POST /api/v1/anonymize endpoint."""
 
     text: str
-    language: str = settings.DEFAULT_LANGUAGE
+    language: SupportedLanguage = settings.DEFAULT_LANGUAGE  # type: ignore[assignment]
     entities: Optional[list[str]] = None  # Anonymize specific entity types only
     nlp_engine: Optional[str] = None  # Override default engine
-    anonymization_strategy: str = "replace"  # replace, mask, redact, etc.
+    anonymization_strategy: AnonymizationStrategy = "replace"
 
     @field_validator("text")
     def validate_text_not_empty(cls, value: str) -> str:
@@ -143,41 +175,10 @@ class AnonymizeTextRequest(BaseModel):
             raise ValueError("Text cannot be empty")
         return value.strip()
 
-    @field_validator("language")
-    def validate_language(cls, value: str) -> str:
-        """Validate language code."""
-        supported_languages = ["nl", "en"]  # Extend as needed
-        if value not in supported_languages:
-            raise ValueError(
-                f"Unsupported language: {value}. Supported: {', '.join(supported_languages)}"
-            )
-        return value
-
     @field_validator("entities")
     def validate_entities(cls, value: Optional[list[str]]) -> Optional[list[str]]:
         """Validate entity types if provided."""
-        if value is not None:
-            unsupported_entities = [
-                entity
-                for entity in value
-                if entity not in settings.SUPPORTED_PII_ENTITIES_TO_ANONYMIZE
-            ]
-            if unsupported_entities:
-                raise ValueError(
-                    f"Unsupported entities: {', '.join(unsupported_entities)}. "
-                    f"Supported: {', '.join(settings.SUPPORTED_PII_ENTITIES_TO_ANONYMIZE)}"
-                )
-        return value
-
-    @field_validator("anonymization_strategy")
-    def validate_strategy(cls, value: str) -> str:
-        """Validate anonymization strategy."""
-        supported_strategies = ["replace", "mask", "redact", "hash"]
-        if value not in supported_strategies:
-            raise ValueError(
-                f"Unsupported strategy: {value}. Supported: {', '.join(supported_strategies)}"
-            )
-        return value
+        return _validate_entities(value)
 
 
 class AnonymizeTextResponse(BaseModel):
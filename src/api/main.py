@@ -1,11 +1,33 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.api.config import settings, setup_logging
 from src.api.routers import router
+from src.api.services.text_analyzer import ModularTextAnalyzer
+from src.api.utils.responses import OrjsonResponse
 
 setup_logging()
 
+# Start loading the model as soon as the app module is imported, so it overlaps
+# with the rest of the server start-up instead of following it
+_analyzer_future = ModularTextAnalyzer.preload()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Wait for the default analyzer to be loaded before serving requests."""
+    # NER runs on its own pool; give sync endpoints and dependencies more room
+    # than anyio's default of 40 so they never queue behind it
+    to_thread.current_default_thread_limiter().total_tokens = 64
+    app.state.analyzer = await asyncio.wrap_future(_analyzer_future)
+    yield
+
+
 app = FastAPI(
     title="Presidio-NL API",
     description="API voor Nederlandse tekst analyse en anonimisatie",
@@ -13,6 +35,8 @@ app = FastAPI(
     docs_url="/api/v1/docs",
     openapi_url="/api/v1/openapi.json",
     redoc_url="/api/v1/redoc",
+    lifespan=lifespan,
+    default_response_class=OrjsonResponse,
 )
 
 app.add_middleware(
@@ -1,20 +1,43 @@
 import logging
 
+import orjson
+from fastapi import Depends, Response
 from fastapi.routing import APIRouter
 
+from src.api.dependencies import get_user
 from src.api.routers.documents import documents_router
 from src.api.routers.text_analysis import text_analysis_router
+from src.api.services.text_analyzer import clear_result_cache
+from src.api.utils.pdf_xmp import clear_pdf_entities_cache
 
 router = APIRouter(prefix="/api/v1")
 
 
-@router.get("/health")
-def ping() -> dict[str, str]:
+# Vaste body; health checks worden vaak en periodiek aangeroepen
+_HEALTH_BODY = orjson.dumps({"ping": "pong"})
+
+
+@router.get("/health", response_model=dict[str, str])
+async def ping() -> Response:
     """Health check endpoint.
 
     Geeft een eenvoudige status terug om te controleren of de API draait.
+    Async en met een vooraf geserialiseerde body, dus zonder threadpool-hop
+    of response-validatie per aanroep.
+    """
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
+@router.post("/cache/clear")
+def clear_cache(username: str = Depends(get_user)) -> dict[str, str]:
+    """Leeg de cache met analyseresultaten.
+
+    Bijvoorbeeld na het wijzigen van recognizers of modellen zonder herstart.
     """
-    return {"ping": "pong"}
+    clear_result_cache()
+    clear_pdf_entities_cache()
+    logging.info(f"Analysis result cache cleared by {username}")
+    return {"status": "cleared"}
 
 
 router.include_router(documents_router)
@@ -11,11 +11,14 @@ from fastapi import (
     BackgroundTasks,
     Depends,
     HTTPException,
+    Response,
     UploadFile,
     status,
 )
 from fastapi import File as FastAPIFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from src.api.config import settings
@@ -24,7 +27,7 @@ from src.api.crud import (
     get_document,
     update_document_anonymized_path,
 )
-from src.api.dependencies import get_db
+from src.api.dependencies import get_analyzer, get_db
 from src.api.dtos import (
     AddDocumentResponse,
     AddDocumentResponseSuccess,
@@ -33,6 +36,7 @@ from src.api.dtos import (
     DocumentDto,
     DocumentTagDto,
 )
+from src.api.services.text_analyzer import ModularTextAnalyzer
 from src.api.utils import pdf_xmp
 
 logger = logging.getLogger(__name__)
@@ -54,19 +58,29 @@ def validate_files_extensions(files: list[UploadFile]) -> None:
         )
 
 
+def _model_response(model: BaseModel) -> Response:
+    # The model is built from trusted values (model_construct); dump it to JSON
+    # bytes with its own compiled serializer instead of having FastAPI validate it
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
 @documents_router.post(
     "/upload",
+    response_model=AddDocumentResponse,
 )
 async def upload_document(
     files: list[UploadFile] = FastAPIFile(...),
     tags: Optional[list[str]] = None,
     db: Session = Depends(get_db),
+    analyzer: ModularTextAnalyzer = Depends(get_analyzer),
     # username: str = Depends(get_user),
-) -> AddDocumentResponse:
+) -> Response:
     validate_files_extensions(files)
-    docs = await pdf_xmp.upload_and_analyze_files(files=files, tags=tags, db=db)
+    docs = await pdf_xmp.upload_and_analyze_files(
+        files=files, tags=tags, db=db, analyzer=analyzer
+    )
 
-    return AddDocumentResponseSuccess(files=docs)
+    return _model_response(AddDocumentResponseSuccess.model_construct(files=docs))
 
 
 @documents_router.post("/deanonymize")
@@ -88,8 +102,10 @@ async def deanonymize_document(
     try:
         key = settings.CRYPTO_KEY.decode()
         try:
-            doc = pdf_xmp.process_anonymized_pdf_to_deanonymize(
-                anon_path=anon_path, key=key
+            doc = await run_in_threadpool(
+                pdf_xmp.process_anonymized_pdf_to_deanonymize,
+                anon_path=anon_path,
+                key=key,
             )
         except ValueError as ve:
             logger.error(
@@ -99,7 +115,8 @@ async def deanonymize_document(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail="No anonymization metadata found in the document",
             )
-        background = pdf_xmp.save_document_and_cleanup(
+        background = await run_in_threadpool(
+            pdf_xmp.save_document_and_cleanup,
             anon_path=anon_path,
             deanon_path=deanon_path,
             doc=doc,
@@ -149,73 +166,60 @@ async def get_document_metadata(
     file_id: str,
     details: bool = False,
     db: Session = Depends(get_db),
+    analyzer: ModularTextAnalyzer = Depends(get_analyzer),
     # username: str = Depends(get_user),
-) -> DocumentDto:
+) -> Response:
     """Get metadata for a specific document. Same response as upload."""
     file_id_check(file_id)
-    doc = get_document(db, file_id)
+    doc = get_document(db, file_id, with_tags=True)
     if not doc:
         raise HTTPException(status_code=404, detail="Document not found")
 
-    tags = [DocumentTagDto(id=str(tag.id), name=str(tag.name)) for tag in doc.tags]
+    # Values come from our own database rows; skip per-field validation
+    tags = [
+        DocumentTagDto.model_construct(id=str(tag.id), name=str(tag.name))
+        for tag in doc.tags
+    ]
 
     if details:
-        # Try to use stored PII entities first
-        unique_entities = []
-        if doc.pii_entities:
-            try:
-                import json
-
-                stored_entities = json.loads(doc.pii_entities)
-                # Convert to unique entities format (entity_type and text only)
-                seen = set()
-                for entity in stored_entities:
-                    key = (entity.get("entity_type", ""), entity.get("text", ""))
-                    if (
-                        key not in seen
-                        and entity.get("entity_type")
-                        and entity.get("text")
-                    ):
-                        unique_entities.append(
-                            {
-                                "entity_type": entity["entity_type"],
-                                "text": entity["text"],
-                            }
-                        )
-                        seen.add(key)
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning(
-                    f"Failed to parse stored PII entities for document {file_id}: {e}"
-                )
+        # Try to use stored PII entities first (entity_type and text only)
+        unique_entities = pdf_xmp.unique_entities(doc.pii_entities or [])
 
         # Fallback: re-analyze if no stored entities found
         if not unique_entities:
             try:
-                text = pdf_xmp.extract_text_from_pdf(Path(doc.source_path))
-                _, unique_entities = await pdf_xmp.extract_unique_entities(text=text)
+                entities = await run_in_threadpool(
+                    pdf_xmp.analyze_pdf, Path(doc.source_path), analyzer
+                )
+                unique_entities = pdf_xmp.unique_entities(entities)
             except Exception as e:
                 logger.warning(f"Failed to re-analyze document {file_id}: {e}")
                 unique_entities = []
     else:
         unique_entities = []
 
-    return DocumentDto(
-        id=str(doc.id),
-        filename=str(doc.filename),
-        content_type=str(doc.content_type),
-        uploaded_at=datetime.now(),  # Use current time as fallback
-        tags=tags,
-        pii_entities=unique_entities,
+    return _model_response(
+        DocumentDto.model_construct(
+            id=str(doc.id),
+            filename=str(doc.filename),
+            content_type=str(doc.content_type),
+            uploaded_at=datetime.now(),  # Use current time as fallback
+            tags=tags,
+            pii_entities=unique_entities,
+        )
     )
 
 
-@documents_router.post("/{file_id}/anonymize")
+@documents_router.post(
+    "/{file_id}/anonymize", response_model=DocumentAnonymizationResponse
+)
 async def anonymize_document(
     file_id: str,
     request_body: DocumentAnonymizationRequest,
     db: Session = Depends(get_db),
+    analyzer: ModularTextAnalyzer = Depends(get_analyzer),
     # username: str = Depends(get_user),
-) -> DocumentAnonymizationResponse:
+) -> Response:
     """Anonymize a specific document."""
     start = time.perf_counter()
     file_id_check(file_id)
@@ -224,13 +228,15 @@ async def anonymize_document(
         raise HTTPException(status_code=404, detail="Document not found")
 
     try:
-        result: pdf_xmp.AnalysisAnonymizationResponse = (
-            pdf_xmp.analyze_and_anonymize_document(
-                file_id=file_id,
-                request_body=request_body,
-                doc=doc,
-                key=settings.CRYPTO_KEY.decode(),
-            )
+        # PDF parsing, NER, redaction and encryption all block; keep them off
+        # the event loop
+        result: pdf_xmp.AnalysisAnonymizationResponse = await run_in_threadpool(
+            pdf_xmp.analyze_and_anonymize_document,
+            file_id=file_id,
+            request_body=request_body,
+            doc=doc,
+            key=settings.CRYPTO_KEY.decode(),
+            analyzer=analyzer,
         )
     except Exception as e:
         raise HTTPException(
@@ -251,13 +257,13 @@ async def anonymize_document(
             os.unlink(out_path)
 
         # Create anonymization event to record the failure
-        event = create_anonymization_event(
+        create_anonymization_event(
             db,
             document_id=file_id,
             time_taken=time_ms_taken,
             status=status_text,
+            pii_entities=selected or None,
         )
-        event._pii_entities = selected
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -265,22 +271,27 @@ async def anonymize_document(
         )
 
     # update DB entries
-    updated_doc = update_document_anonymized_path(db, file_id, str(out_path))
-    event = create_anonymization_event(
+    # The path update is committed together with the event below
+    updated_doc = update_document_anonymized_path(
+        db, file_id, str(out_path), commit=False
+    )
+    create_anonymization_event(
         db,
         document_id=file_id,
         time_taken=time_ms_taken,
         status=status_text,
+        pii_entities=selected or None,
     )
-    event._pii_entities = selected
 
-    return DocumentAnonymizationResponse(
-        id=file_id,
-        filename=str(updated_doc.filename) if updated_doc else "",
-        anonymized_at=datetime.now(),  # Use current time for response
-        time_taken=time_ms_taken,
-        status=status_text,
-        pii_entities=selected,
+    return _model_response(
+        DocumentAnonymizationResponse.model_construct(
+            id=file_id,
+            filename=str(updated_doc.filename) if updated_doc else "",
+            anonymized_at=datetime.now(),  # Use current time for response
+            time_taken=time_ms_taken,
+            status=status_text,
+            pii_entities=selected,
+        )
     )
 
 
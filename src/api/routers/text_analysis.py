@@ -1,50 +1,87 @@
+import asyncio
 import logging
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, Callable, TypeVar
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 from src.api.config import settings
+from src.api.dependencies import get_analyzer, json_body, json_body_openapi
 from src.api.dtos import (
+    AnalyzeTextBatchRequest,
+    AnalyzeTextBatchResponse,
     AnalyzeTextRequest,
     AnalyzeTextResponse,
     AnonymizeTextRequest,
     AnonymizeTextResponse,
-    PIIEntity,
 )
 from src.api.services.text_analyzer import ModularTextAnalyzer
+from src.api.utils.responses import OrjsonResponse
 
 logger = logging.getLogger(__name__)
 text_analysis_router = APIRouter(tags=["text-analysis"])
 
+T = TypeVar("T")
 
-def create_pii_entities_from_results(results: list[dict]) -> list[PIIEntity]:
-    """Convert ModularTextAnalyzer results to PIIEntity DTOs."""
+# Analysis blocks a thread for its full duration. Running it on a dedicated
+# pool keeps it from starving the event loop and the anyio threadpool used by
+# cheap endpoints. Each analysis hands its model forward to
+# ModularTextAnalyzer's pool, so both are sized from NLP_WORKERS; a larger
+# pool here would only queue requests behind that one.
+NER_POOL = ThreadPoolExecutor(
+    max_workers=settings.NLP_WORKERS, thread_name_prefix="ner"
+)
+
+
+async def run_in_ner_pool(func: Callable[[], T]) -> T:
+    """Run a blocking NER call on NER_POOL without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(NER_POOL, func)
+
+
+def _select_analyzer(
+    default_analyzer: ModularTextAnalyzer, nlp_engine: str
+) -> ModularTextAnalyzer:
+    """Reuse the preloaded analyzer unless another engine was requested."""
+    if nlp_engine == default_analyzer.nlp_engine_name:
+        return default_analyzer
+    return ModularTextAnalyzer.get(nlp_engine=nlp_engine)
+
+
+def create_pii_entities_from_results(results: list[dict]) -> list[dict]:
+    """Convert ModularTextAnalyzer results to plain PIIEntity-shaped dicts."""
     pii_entities = []
     for result in results:
         # Handle different score types (some models return empty string, others float)
         score = result.get("score")
-        if score == "" or score is None:
-            score = None
-        elif isinstance(score, str) and score.strip() == "":
-            score = None
+        if isinstance(score, str):
+            score = score if score.strip() else None
+        elif score is not None:
+            # Transformers returns numpy floats; report them as plain floats
+            score = float(score)
 
         pii_entities.append(
-            PIIEntity(
-                entity_type=result["entity_type"],
-                text=result["text"],
-                start=result["start"],
-                end=result["end"],
-                score=score,
-            )
+            {
+                "entity_type": result["entity_type"],
+                "text": result["text"],
+                "start": result["start"],
+                "end": result["end"],
+                "score": score,
+            }
         )
     return pii_entities
 
 
-@text_analysis_router.post("/analyze")
+@text_analysis_router.post(
+    "/analyze",
+    response_model=AnalyzeTextResponse,
+    openapi_extra=json_body_openapi(AnalyzeTextRequest),
+)
 async def analyze_text(
-    request: AnalyzeTextRequest,
-) -> AnalyzeTextResponse:
+    request: Annotated[AnalyzeTextRequest, Depends(json_body(AnalyzeTextRequest))],
+    default_analyzer: ModularTextAnalyzer = Depends(get_analyzer),
+) -> Response:
     """Analyze text for PII entities using the specified NLP engine.
 
     This endpoint accepts a text string and returns detected PII entities
@@ -52,6 +89,8 @@ async def analyze_text(
 
     Args:
         request: AnalyzeTextRequest containing text and analysis parameters
+        default_analyzer: Shared analyzer loaded at startup, used unless
+            the request selects another NLP engine
 
     Returns:
         AnalyzeTextResponse with detected PII entities and metadata
@@ -62,16 +101,16 @@ async def analyze_text(
     start_time = time.perf_counter()
 
     try:
-        # Initialize analyzer with specified engine or use default
         nlp_engine = request.nlp_engine or settings.DEFAULT_NLP_ENGINE
-        analyzer = ModularTextAnalyzer(nlp_engine=nlp_engine)
 
-        # Perform analysis
+        # Perform analysis; loading another engine also blocks, so it runs there too
         entities_to_analyze = request.entities or settings.DEFAULT_ENTITIES
-        results = analyzer.analyze_text(
-            text=request.text,
-            entities=entities_to_analyze,
-            language=request.language,
+        results = await run_in_ner_pool(
+            lambda: _select_analyzer(default_analyzer, nlp_engine).analyze_text(
+                text=request.text,
+                entities=entities_to_analyze,
+                language=request.language,
+            )
         )
 
         # Convert results to DTOs
@@ -85,11 +124,14 @@ async def analyze_text(
             f"in {processing_time_ms}ms using {nlp_engine} engine"
         )
 
-        return AnalyzeTextResponse(
-            pii_entities=pii_entities,
-            text_length=len(request.text),
-            processing_time_ms=processing_time_ms,
-            nlp_engine_used=nlp_engine,
+        # Plain dicts: serialize directly instead of building and validating models
+        return OrjsonResponse(
+            {
+                "pii_entities": pii_entities,
+                "text_length": len(request.text),
+                "processing_time_ms": processing_time_ms,
+                "nlp_engine_used": nlp_engine,
+            }
         )
 
     except Exception as e:
@@ -100,10 +142,90 @@ async def analyze_text(
         )
 
 
-@text_analysis_router.post("/anonymize")
+@text_analysis_router.post(
+    "/analyze/batch",
+    response_model=AnalyzeTextBatchResponse,
+    openapi_extra=json_body_openapi(AnalyzeTextBatchRequest),
+)
+async def analyze_text_batch(
+    request: Annotated[
+        AnalyzeTextBatchRequest, Depends(json_body(AnalyzeTextBatchRequest))
+    ],
+    default_analyzer: ModularTextAnalyzer = Depends(get_analyzer),
+) -> Response:
+    """Analyze multiple texts for PII entities in a single batch.
+
+    All texts are run through the NLP pipeline together, which is considerably
+    faster than calling /analyze once per text.
+
+    Args:
+        request: AnalyzeTextBatchRequest containing the texts and analysis parameters
+        default_analyzer: Shared analyzer loaded at startup, used unless
+            the request selects another NLP engine
+
+    Returns:
+        AnalyzeTextBatchResponse with one AnalyzeTextResponse per input text
+
+    Raises:
+        HTTPException: On analysis failure or invalid parameters
+    """
+    start_time = time.perf_counter()
+
+    try:
+        nlp_engine = request.nlp_engine or settings.DEFAULT_NLP_ENGINE
+
+        entities_to_analyze = request.entities or settings.DEFAULT_ENTITIES
+        batch_results = await run_in_ner_pool(
+            lambda: _select_analyzer(default_analyzer, nlp_engine).analyze_texts(
+                texts=request.texts,
+                entities=entities_to_analyze,
+                language=request.language,
+            )
+        )
+
+        results = [
+            {
+                "pii_entities": create_pii_entities_from_results(text_results),
+                "text_length": len(text),
+                "processing_time_ms": None,
+                "nlp_engine_used": nlp_engine,
+            }
+            for text, text_results in zip(request.texts, batch_results)
+        ]
+
+        end_time = time.perf_counter()
+        processing_time_ms = int((end_time - start_time) * 1000)
+
+        logger.info(
+            f"Batch text analysis completed: {len(results)} texts "
+            f"in {processing_time_ms}ms using {nlp_engine} engine"
+        )
+
+        return OrjsonResponse(
+            {
+                "results": results,
+                "processing_time_ms": processing_time_ms,
+                "nlp_engine_used": nlp_engine,
+            }
+        )
+
+    except Exception as e:
+        logger.error(f"Batch text analysis failed: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Batch text analysis failed: {str(e)}",
+        )
+
+
+@text_analysis_router.post(
+    "/anonymize",
+    response_model=AnonymizeTextResponse,
+    openapi_extra=json_body_openapi(AnonymizeTextRequest),
+)
 async def anonymize_text(
-    request: AnonymizeTextRequest,
-) -> AnonymizeTextResponse:
+    request: Annotated[AnonymizeTextRequest, Depends(json_body(AnonymizeTextRequest))],
+    default_analyzer: ModularTextAnalyzer = Depends(get_analyzer),
+) -> Response:
     """Anonymize PII entities in text using the specified strategy.
 
     This endpoint accepts a text string and returns the anonymized version
@@ -111,6 +233,8 @@ async def anonymize_text(
 
     Args:
         request: AnonymizeTextRequest containing text and anonymization parameters
+        default_analyzer: Shared analyzer loaded at startup, used unless
+            the request selects another NLP engine
 
     Returns:
         AnonymizeTextResponse with original text, anonymized text, and entities found
@@ -121,24 +245,28 @@ async def anonymize_text(
     start_time = time.perf_counter()
 
     try:
-        # Initialize analyzer with specified engine or use default
         nlp_engine = request.nlp_engine or settings.DEFAULT_NLP_ENGINE
-        analyzer = ModularTextAnalyzer(nlp_engine=nlp_engine)
 
-        # First analyze to find entities
         entities_to_analyze = request.entities or settings.DEFAULT_ENTITIES
-        analysis_results = analyzer.analyze_text(
-            text=request.text,
-            entities=entities_to_analyze,
-            language=request.language,
-        )
 
-        # Then anonymize the text
-        anonymized_text = analyzer.anonymize_text(
-            text=request.text,
-            entities=entities_to_analyze,
-            language=request.language,
-        )
+        def analyze_and_anonymize() -> tuple[list[dict], str]:
+            analyzer = _select_analyzer(default_analyzer, nlp_engine)
+            # First analyze to find entities
+            analysis_results = analyzer.analyze_text(
+                text=request.text,
+                entities=entities_to_analyze,
+                language=request.language,
+            )
+            # Then anonymize the text using the entities found above
+            anonymized_text = analyzer.anonymize_text(
+                text=request.text,
+                entities=entities_to_analyze,
+                language=request.language,
+                results=analysis_results,
+            )
+            return analysis_results, anonymized_text
+
+        analysis_results, anonymized_text = await run_in_ner_pool(analyze_and_anonymize)
 
         # Convert analysis results to DTOs
         entities_found = create_pii_entities_from_results(analysis_results)
@@ -151,14 +279,16 @@ async def anonymize_text(
             f"in {processing_time_ms}ms using {nlp_engine} engine and {request.anonymization_strategy} strategy"
         )
 
-        return AnonymizeTextResponse(
-            original_text=request.text,
-            anonymized_text=anonymized_text,
-            entities_found=entities_found,
-            text_length=len(request.text),
-            processing_time_ms=processing_time_ms,
-            nlp_engine_used=nlp_engine,
-            anonymization_strategy=request.anonymization_strategy,
+        return OrjsonResponse(
+            {
+                "original_text": request.text,
+                "anonymized_text": anonymized_text,
+                "entities_found": entities_found,
+                "text_length": len(request.text),
+                "processing_time_ms": processing_time_ms,
+                "nlp_engine_used": nlp_engine,
+                "anonymization_strategy": request.anonymization_strategy,
+            }
         )
 
     except Exception as e:
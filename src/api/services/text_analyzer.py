@@ -1,11 +1,19 @@
+import hashlib
 import logging
-from typing import List, Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Collection, FrozenSet, Iterator, List, Optional, Tuple
 
+import spacy
 from presidio_analyzer import AnalyzerEngine, RecognizerRegistry, RecognizerResult
-from presidio_analyzer.nlp_engine import NlpEngineProvider
+from presidio_analyzer.nlp_engine import SpacyNlpEngine
 
 from src.api.config import settings
+from src.api.utils.cache import LRUCache
+from src.api.utils.nlp.base import NLPEngine
 from src.api.utils.nlp.loader import load_nlp_engine
+from src.api.utils.nlp.spacy_engine import clear_ents_cache
 from src.api.utils.patterns import (
     CaseNumberRecognizer,
     DutchBSNRecognizer,
@@ -15,8 +23,101 @@ from src.api.utils.patterns import (
     DutchPassportIdRecognizer,
     DutchPhoneNumberRecognizer,
     EmailRecognizer,
+    MultiPatternRecognizer,
 )
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=4)
+def _build_engines(
+    nlp_engine: str, model_name: str
+) -> Tuple[NLPEngine, AnalyzerEngine]:
+    """Laad de NLP-engine en bouw de Presidio AnalyzerEngine, één keer per configuratie.
+
+    Het resultaat wordt gecachet zodat elke `ModularTextAnalyzer` met dezelfde
+    engine en hetzelfde model de geladen modellen en recognizers deelt.
+
+    Args:
+        nlp_engine (str): naam van de NLP-engine ("spacy" of "transformers").
+        model_name (str): naam van het te laden model.
+
+    Returns:
+        Tuple[NLPEngine, AnalyzerEngine]: de NLP-engine en de Presidio analyzer.
+    """
+    engine = load_nlp_engine(
+        config_dict={"nlp_engine": nlp_engine, "model_name": model_name}
+    )
+
+    # Presidio always uses SpaCy for pattern recognizers, regardless of our NLP engine choice.
+    # The pattern recognizers only need tokens (for context words), so a blank
+    # pipeline is enough; the full model would run tok2vec+NER a second time
+    # per text next to our own NER call.
+    presidio_nlp = spacy.blank(settings.DEFAULT_LANGUAGE)
+    presidio_spacy_engine = SpacyNlpEngine(
+        models=[
+            {
+                "lang_code": settings.DEFAULT_LANGUAGE,
+                "model_name": presidio_nlp.meta.get("name", "blank"),
+            }
+        ]
+    )
+    presidio_spacy_engine.nlp = {settings.DEFAULT_LANGUAGE: presidio_nlp}
+
+    # reuse the recognizer registry for the analyzer engine
+    registry = RecognizerRegistry()
+    registry.supported_languages = [settings.DEFAULT_LANGUAGE]
+
+    recognizers_to_add = [
+        # E-mail, IBAN, telefoon, ID-nummers en datums in één regex-doorloop; de
+        # langere/specifiekere patronen eerst zodat bijv. cijfers in een IBAN
+        # geen telefoonnummer worden. Zaaknummers overlappen met de andere
+        # patronen en houden daarom een eigen doorloop.
+        MultiPatternRecognizer(
+            [
+                EmailRecognizer(),
+                DutchIBANRecognizer(),
+                DutchPhoneNumberRecognizer(),
+                DutchBSNRecognizer(),
+                DutchPassportIdRecognizer(),
+                DutchDriversLicenseRecognizer(),
+                DutchDateRecognizer(),
+            ],
+            required_literals={"EMAIL": "@"},
+        ),
+        CaseNumberRecognizer(),
+    ]
+    for recognizer in recognizers_to_add:
+        registry.add_recognizer(recognizer=recognizer)
+
+    # Initialiseer de AnalyzerEngine met SpaCy-engine voor pattern recognizers
+    analyzer = AnalyzerEngine(
+        nlp_engine=presidio_spacy_engine,
+        registry=registry,
+        supported_languages=registry.supported_languages,
+    )
+    logging.debug(
+        f"ModularTextAnalyzer is initialized with {len(recognizers_to_add)} recognizers, "
+        f"{nlp_engine=}, {model_name=}"
+    )
+    return engine, analyzer
+
+
+# Korte tekst met een naam, plaats en telefoonnummer voor `warm_up`
+_WARM_UP_TEXT = "Jan Jansen woont in Utrecht en is bereikbaar op 06-12345678."
+
+# Gedeeld door alle analyzers; de sleutel bevat engine en model
+_result_cache: LRUCache[tuple] = LRUCache(settings.ANALYSIS_CACHE_SIZE)
+
+# Membership checks op een frozenset zijn O(1); één keer opgebouwd per proces
+_DEFAULT_ENTITY_SET = settings.DEFAULT_ENTITY_SET
+
+
+def clear_result_cache() -> None:
+    """Leeg de cache met analyseresultaten en de NER-uitvoer van SpaCy."""
+    _result_cache.clear()
+    clear_ents_cache()
+
 
 class ModularTextAnalyzer:
     """Modulaire analyzer-klasse voor Nederlandse tekst.
@@ -34,6 +135,11 @@ class ModularTextAnalyzer:
     van de modulaire architectuur van deze service.
     """
 
+    # Gedeeld door alle instanties: draait de NER naast de pattern recognizers
+    _pool = ThreadPoolExecutor(
+        max_workers=settings.NLP_WORKERS, thread_name_prefix="nlp"
+    )
+
     def __init__(
         self,
         model_name: Optional[str] = None,
@@ -45,72 +151,122 @@ class ModularTextAnalyzer:
                 if nlp_engine == "spacy"
                 else settings.DEFAULT_TRANSFORMERS_MODEL
             )
-        self.nlp_engine = load_nlp_engine(
-            config_dict={"nlp_engine": nlp_engine, "model_name": model_name}
-        )
+        self.nlp_engine_name = nlp_engine
+        self.model_name = model_name
+        self.nlp_engine, self.analyzer = _build_engines(nlp_engine, model_name)
 
-        # Presidio always uses SpaCy for pattern recognizers, regardless of our NLP engine choice
-        spacy_config = {
-            "nlp_engine_name": "spacy",  # Presidio only supports spacy
-            "models": [
-                {
-                    "lang_code": settings.DEFAULT_LANGUAGE,
-                    "model_name": settings.DEFAULT_SPACY_MODEL,  # Always use SpaCy model for Presidio
-                }
-            ],
-        }
-
-        spacy_provider = NlpEngineProvider(nlp_configuration=spacy_config)
-        presidio_spacy_engine = spacy_provider.create_engine()
-
-        # reuse the recognizer registry for the analyzer engine
-        registry = RecognizerRegistry()
-        registry.supported_languages = [settings.DEFAULT_LANGUAGE]
-
-        recognizers_to_add = [
-            DutchPhoneNumberRecognizer(),
-            DutchIBANRecognizer(),
-            DutchBSNRecognizer(),
-            DutchDateRecognizer(),
-            EmailRecognizer(),
-            DutchPassportIdRecognizer(),
-            DutchDriversLicenseRecognizer(),
-            CaseNumberRecognizer(),
-        ]
-        for recognizer in recognizers_to_add:
-            registry.add_recognizer(recognizer=recognizer)
-
-        # Initialiseer de AnalyzerEngine met SpaCy-engine voor pattern recognizers
-        self.analyzer = AnalyzerEngine(
-            nlp_engine=presidio_spacy_engine,
-            registry=registry,
-            supported_languages=registry.supported_languages,
-        )
-        logging.debug(
-            f"ModularTextAnalyzer is initialized with {len(recognizers_to_add)} recognizers, {spacy_config=}"
-        )
+    @classmethod
+    def get(
+        cls,
+        model_name: Optional[str] = None,
+        nlp_engine: str = settings.DEFAULT_NLP_ENGINE,
+    ) -> "ModularTextAnalyzer":
+        """Geef de gedeelde analyzer voor deze engine en dit model.
+
+        De instantie wordt bij de eerste aanroep gebouwd en daarna per proces
+        hergebruikt, zodat het NLP-model niet per request of document opnieuw
+        wordt geladen.
+
+        Args:
+            model_name (str, optional): het te gebruiken model. Defaults to None.
+            nlp_engine (str, optional): de NLP-engine. Defaults to DEFAULT_NLP_ENGINE.
+
+        Returns:
+            ModularTextAnalyzer: de gedeelde analyzer.
+        """
+        # lru_cache laat gelijktijdige eerste aanroepen allebei het model laden;
+        # de lock laat een request tijdens `preload` op dat laden wachten
+        with _shared_analyzer_lock:
+            return _shared_analyzer(model_name, nlp_engine)
+
+    @classmethod
+    def preload(
+        cls,
+        model_name: Optional[str] = None,
+        nlp_engine: str = settings.DEFAULT_NLP_ENGINE,
+    ) -> "Future[ModularTextAnalyzer]":
+        """Begin op de achtergrond met het bouwen van de gedeelde analyzer.
+
+        Het laden van het model overlapt zo met het opstarten van de rest van de
+        applicatie; `get` met dezelfde argumenten wacht daarna niet opnieuw.
+        Na het laden draait één korte analyse (zie `warm_up`).
+
+        Args:
+            model_name (str, optional): het te gebruiken model. Defaults to None.
+            nlp_engine (str, optional): de NLP-engine. Defaults to DEFAULT_NLP_ENGINE.
+
+        Returns:
+            Future[ModularTextAnalyzer]: future met de gedeelde analyzer.
+        """
+        return cls._pool.submit(lambda: cls.get(model_name, nlp_engine).warm_up())
+
+    def warm_up(self) -> "ModularTextAnalyzer":
+        """Draai één korte analyse zodat lazy initialisatie niet in het eerste request valt.
+
+        Bij de eerste aanroep maken de NLP-pipeline en de recognizers nog hun
+        buffers en interne caches aan; dat gebeurt zo tijdens het opstarten.
+        De engines worden direct aangeroepen, buiten de resultaatcache om.
+        """
+        try:
+            self.nlp_engine.analyze(_WARM_UP_TEXT)
+            self.analyzer.analyze(
+                text=_WARM_UP_TEXT, language=settings.DEFAULT_LANGUAGE
+            )
+        except Exception as e:
+            logging.warning(f"Warm-up of the analyzer failed: {e}")
+        return self
 
     def analyze_text(
         self,
         text: str,
-        entities: list = settings.DEFAULT_ENTITIES,
+        entities: Optional[Collection[str]] = None,
         language: str = settings.DEFAULT_LANGUAGE,
     ) -> list:
         """Analyseer tekst met behulp van de NLP-engine en pattern recognizers.
 
+        Teksten langer dan `NLP_MAX_CHUNK_CHARS` worden in stukken gesplitst en
+        als batch geanalyseerd; de posities verwijzen altijd naar de originele tekst.
+        Resultaten worden gecachet (zie `ANALYSIS_CACHE_SIZE`), zodat een
+        herhaalde tekst de NLP-pipeline niet opnieuw doorloopt.
+
         Args:
             text (str): de tekst om te analyseren.
-            entities (list, optional): entities om te analyseren. Defaults to DEFAULT_ENTITIES.
+            entities (Collection[str], optional): entities om te analyseren; None
+                betekent DEFAULT_ENTITIES, een lege lijst alle entities. Defaults to None.
             language (str, optional): taal om in te analyseren. Defaults to DEFAULT_LANGUAGE.
 
         Returns:
             list: lijst van gedetecteerde entiteiten met hun start- en eindposities, type en score.
         """
         logging.debug(f"Analyzing text with {entities=} and {language=}")
+        entity_set = _entity_set(entities)
 
-        # Analyze with NLP engine (supports entity filtering)
-        nlp_results = self.nlp_engine.analyze(text, entities, language)
-        print(f"nlp_results: {nlp_results}")
+        key = (
+            self.nlp_engine_name,
+            self.model_name,
+            hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(),
+            entity_set,
+            language,
+        )
+        cached = _result_cache.get(key)
+        if cached is not None:
+            return [dict(r) for r in cached]
+
+        results = self._analyze_uncached(text, entity_set, language)
+        _result_cache.put(key, tuple(dict(r) for r in results))
+        return results
+
+    def _analyze_uncached(
+        self, text: str, entities: Optional[FrozenSet[str]], language: str
+    ) -> list:
+        if len(text) > settings.NLP_MAX_CHUNK_CHARS:
+            return self._analyze_chunked([text], entities, language)[0]
+
+        # Analyze with NLP engine (supports entity filtering) in the background;
+        # the pattern recognizers below don't depend on its results
+        nlp_future = self._pool.submit(
+            self.nlp_engine.analyze, text, entities, language
+        )
 
         # Use pattern recognizers via Presidio AnalyzerEngine (detect ALL patterns first)
         try:
@@ -119,66 +275,285 @@ class ModularTextAnalyzer:
                 entities=None,
                 language=language,  # Don't filter here
             )
-            print(f"pattern_results: {pattern_results}")
         except Exception as e:
             logging.warning(f"Pattern analysis failed: {e}")
             pattern_results = []
+        nlp_results = nlp_future.result()
 
-        # Convert pattern results to dict format
-        pattern_dicts = [
-            {
-                "entity_type": r.entity_type,
-                "start": r.start,
-                "end": r.end,
-                "score": r.score,
-                "text": text[r.start : r.end],
-            }
-            for r in pattern_results
+        # Alleen formatteren als debuglogging aan staat; de repr van alle
+        # resultaten is anders per aanroep pure overhead
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"nlp_results: {nlp_results}")
+            logger.debug(f"pattern_results: {pattern_results}")
+
+        return self._merge_results(text, nlp_results, pattern_results, entities)
+
+    def analyze_texts(
+        self,
+        texts: List[str],
+        entities: Optional[Collection[str]] = None,
+        language: str = settings.DEFAULT_LANGUAGE,
+    ) -> list[list]:
+        """Analyseer meerdere teksten in één batch.
+
+        De NLP-engine en de SpaCy-pipeline van Presidio verwerken alle teksten
+        in één `pipe`-aanroep; alleen de (goedkope) regex-recognizers draaien
+        nog per tekst, terwijl de NER op de achtergrond loopt. Teksten langer
+        dan `NLP_MAX_CHUNK_CHARS` worden eerst in stukken gesplitst; alle stukken
+        van alle teksten gaan samen in dezelfde batch.
+
+        Args:
+            texts (List[str]): de teksten om te analyseren.
+            entities (Collection[str], optional): entities om te analyseren; None
+                betekent DEFAULT_ENTITIES, een lege lijst alle entities. Defaults to None.
+            language (str, optional): taal om in te analyseren. Defaults to DEFAULT_LANGUAGE.
+
+        Returns:
+            list[list]: per tekst een lijst van gedetecteerde entiteiten, in dezelfde volgorde als de invoer.
+        """
+        logging.debug(f"Analyzing {len(texts)} texts with {entities=} and {language=}")
+        return self._analyze_chunked(texts, _entity_set(entities), language)
+
+    def analyze_pages(
+        self,
+        documents: List[List[str]],
+        entities: Optional[Collection[str]] = None,
+        language: str = settings.DEFAULT_LANGUAGE,
+    ) -> list[list]:
+        """Analyseer documenten die per pagina zijn aangeleverd in één batch.
+
+        Alle pagina's van alle documenten gaan als losse teksten door de
+        pipeline, zodat een lang document niet als één grote tekst wordt
+        verwerkt. Lege pagina's worden overgeslagen. De posities in het
+        resultaat zijn relatief aan de pagina's van een document samengevoegd
+        met een regeleinde ertussen, net als `extract_text_from_pdf`.
+
+        Args:
+            documents (List[List[str]]): per document de tekst van elke pagina.
+            entities (Collection[str], optional): zie `analyze_texts`. Defaults to None.
+            language (str, optional): taal om in te analyseren. Defaults to DEFAULT_LANGUAGE.
+
+        Returns:
+            list[list]: per document een lijst van gedetecteerde entiteiten.
+        """
+        owners: List[Tuple[int, int]] = []
+        pages: List[str] = []
+        for index, document_pages in enumerate(documents):
+            offset = 0
+            for page in document_pages:
+                if page.strip():
+                    owners.append((index, offset))
+                    pages.append(page)
+                offset += len(page) + 1
+
+        results: list[list] = [[] for _ in documents]
+        for (index, offset), page_results in zip(
+            owners, self._analyze_chunked(pages, _entity_set(entities), language)
+        ):
+            for r in page_results:
+                if offset:
+                    r["start"] += offset
+                    r["end"] += offset
+                results[index].append(r)
+        return results
+
+    def _analyze_chunked(
+        self, texts: List[str], entities: Optional[FrozenSet[str]], language: str
+    ) -> list[list]:
+        """Splits te lange teksten, analyseer alle stukken als één batch en voeg ze samen."""
+        owners: List[Tuple[int, int]] = []
+        chunks: List[str] = []
+        for index, text in enumerate(texts):
+            for offset, chunk in chunk_text(text, settings.NLP_MAX_CHUNK_CHARS):
+                owners.append((index, offset))
+                chunks.append(chunk)
+
+        batch_results: list[list] = [[] for _ in texts]
+        for (index, offset), chunk_results in zip(
+            owners, self._analyze_batch(chunks, entities, language)
+        ):
+            for r in chunk_results:
+                if offset:
+                    r["start"] += offset
+                    r["end"] += offset
+                batch_results[index].append(r)
+        return batch_results
+
+    def _analyze_batch(
+        self, texts: List[str], entities: Optional[FrozenSet[str]], language: str
+    ) -> list[list]:
+        nlp_future = self._pool.submit(
+            self.nlp_engine.analyze_batch, texts, entities, language
+        )
+        artifacts_batch = self.analyzer.nlp_engine.process_batch(
+            texts, language, batch_size=settings.NLP_BATCH_SIZE
+        )
+
+        pattern_batch = []
+        for text, (_, nlp_artifacts) in zip(texts, artifacts_batch):
+            try:
+                pattern_results: List[RecognizerResult] = self.analyzer.analyze(
+                    text=text,
+                    entities=None,
+                    language=language,
+                    nlp_artifacts=nlp_artifacts,
+                )
+            except Exception as e:
+                logging.warning(f"Pattern analysis failed: {e}")
+                pattern_results = []
+            pattern_batch.append(pattern_results)
+
+        return [
+            self._merge_results(text, nlp_results, pattern_results, entities)
+            for text, nlp_results, pattern_results in zip(
+                texts, nlp_future.result(), pattern_batch
+            )
         ]
 
-        # Combine all results
-        all_results = nlp_results + pattern_dicts
+    @staticmethod
+    def _merge_results(
+        text: str,
+        nlp_results: list,
+        pattern_results: List[RecognizerResult],
+        entities: Optional[FrozenSet[str]],
+    ) -> list:
+        """Combineer NLP- en patternresultaten, filter op entiteiten en dedupliceer.
 
+        Resultaten met dezelfde (start, end, entity_type) worden in één doorloop
+        samengevoegd tot het resultaat met de hoogste score. De tekst van een
+        patternresultaat wordt alleen uit `text` gesneden als het op dat moment
+        het beste resultaat voor zijn span is.
+        """
         # Filter by requested entities if specified
-        if entities and entities != settings.DEFAULT_ENTITIES:
-            all_results = [r for r in all_results if r["entity_type"] in entities]
+        wanted = entities if entities and entities != _DEFAULT_ENTITY_SET else None
 
-        # Deduplication based on start, end, entity_type
-        seen = set()
-        unique_results = []
-        for r in all_results:
+        # Scores apart bijhouden scheelt per vergelijking een `_score`-aanroep
+        best: dict[tuple, dict] = {}
+        scores: dict[tuple, float] = {}
+        for r in nlp_results:
+            if wanted is not None and r["entity_type"] not in wanted:
+                continue
             key = (r["start"], r["end"], r["entity_type"])
-            if key not in seen:
-                unique_results.append(r)
-                seen.add(key)
+            score = _score(r)
+            if score > scores.get(key, -1.0):
+                best[key] = r
+                scores[key] = score
 
-        return unique_results
+        for p in pattern_results:
+            if wanted is not None and p.entity_type not in wanted:
+                continue
+            key = (p.start, p.end, p.entity_type)
+            if p.score > scores.get(key, -1.0):
+                best[key] = {
+                    "entity_type": p.entity_type,
+                    "start": p.start,
+                    "end": p.end,
+                    "score": p.score,
+                    "text": text[p.start : p.end],
+                }
+                scores[key] = p.score
+
+        return list(best.values())
 
     def anonymize_text(
         self,
         text: str,
-        entities: Optional[List] = None,
+        entities: Optional[Collection[str]] = None,
         language: str = settings.DEFAULT_LANGUAGE,
+        results: Optional[List[dict]] = None,
     ) -> str:
         """Function to anonymize text by replacing detected entities with placeholders.
 
         Args:
             text (str): the text to anonymize.
-            entities (list, optional): the entities to anonymize. Defaults to None.
+            entities (Collection[str], optional): the entities to anonymize;
+                None means DEFAULT_ENTITIES. Defaults to None.
             language (str, optional): the language to anonymize in. Defaults to DEFAULT_LANGUAGE.
+            results (List[dict], optional): results of an earlier `analyze_text` call
+                for this text; the text is only analyzed again when omitted.
 
         Returns:
             str: the anonymized text with placeholders for detected entities.
         """
-        results = self.analyze_text(text, entities, language)  # type: ignore
-
-        # Sorteer op start, zodat vervangen van achter naar voren kan
-        sorted_results = sorted(results, key=lambda x: x["start"], reverse=True)
-        anonymized = text
-        for ent in sorted_results:
-            anonymized = (
-                anonymized[: ent["start"]]
-                + f"<{ent['entity_type']}>"
-                + anonymized[ent["end"] :]
-            )
-        return anonymized
+        if results is None:
+            results = self.analyze_text(text, entities, language)
+
+        return replace_entities(text, results)
+
+
+_shared_analyzer_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4)
+def _shared_analyzer(model_name: Optional[str], nlp_engine: str) -> ModularTextAnalyzer:
+    return ModularTextAnalyzer(model_name=model_name, nlp_engine=nlp_engine)
+
+
+def chunk_text(text: str, max_chars: int = 20000) -> Iterator[Tuple[int, str]]:
+    """Splits tekst in aaneengesloten stukken van hoogstens `max_chars` tekens.
+
+    Er wordt bij voorkeur geknipt na een witregel, dan na een zin, een regel of
+    een spatie, zodat entiteiten zo min mogelijk over twee stukken vallen.
+
+    Args:
+        text (str): de te splitsen tekst.
+        max_chars (int, optional): maximale lengte van een stuk. Defaults to 20000.
+
+    Yields:
+        Tuple[int, str]: de offset van het stuk in `text` en het stuk zelf.
+    """
+    start = 0
+    while len(text) - start > max_chars:
+        end = start + max_chars
+        cut = end
+        for separator in ("\n\n", ". ", "\n", " "):
+            index = text.rfind(separator, start + 1, end)
+            if index != -1:
+                cut = index + len(separator)
+                break
+        yield start, text[start:cut]
+        start = cut
+    yield start, text[start:]
+
+
+def _entity_set(entities: Optional[Collection[str]]) -> Optional[FrozenSet[str]]:
+    # None betekent de standaardset, een lege collectie: geen filter
+    if entities is None or entities is settings.DEFAULT_ENTITIES:
+        return _DEFAULT_ENTITY_SET
+    return frozenset(entities) if entities else None
+
+
+def _score(result: dict) -> float:
+    score = result.get("score")
+    return score if isinstance(score, (int, float)) else 0.0
+
+
+def replace_entities(text: str, results: List[dict]) -> str:
+    """Vervang gevonden entiteiten in één doorloop door `<ENTITY_TYPE>`-placeholders.
+
+    Overlappende spans worden eerst opgelost: van twee overlappende entiteiten
+    blijft die met de hoogste score staan (bij gelijke score de eerste/langste).
+
+    Args:
+        text (str): de originele tekst.
+        results (List[dict]): entiteiten met `start`, `end`, `entity_type` en optioneel `score`.
+
+    Returns:
+        str: de tekst met placeholders op de plaats van de entiteiten.
+    """
+    spans: List[dict] = []
+    for ent in sorted(results, key=lambda r: (r["start"], -r["end"])):
+        if spans and ent["start"] < spans[-1]["end"]:
+            if _score(ent) > _score(spans[-1]):
+                spans[-1] = ent
+            continue
+        spans.append(ent)
+
+    parts = []
+    cursor = 0
+    for ent in spans:
+        parts.append(text[cursor : ent["start"]])
+        parts.append(f"<{ent['entity_type']}>")
+        cursor = ent["end"]
+    parts.append(text[cursor:])
+    return "".join(parts)
@@ -1,5 +1,17 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Collection, FrozenSet, Iterable, Optional
+
+
+def entity_filter(entities: Optional[Collection[str]]) -> Optional[FrozenSet[str]]:
+    """Zet een entity-filter één keer om naar een frozenset.
+
+    De engines testen het label van elke gevonden entity tegen het filter;
+    op een frozenset is dat O(1) in plaats van een scan door een lijst.
+    None (geen filter) blijft None.
+    """
+    if entities is None or isinstance(entities, frozenset):
+        return entities
+    return frozenset(entities)
 
 
 class NLPEngine(ABC):
@@ -10,7 +22,10 @@ class NLPEngine(ABC):
 
     @abstractmethod
     def analyze(
-        self, text: str, entities: Optional[List] = None, language: str = "nl"
+        self,
+        text: str,
+        entities: Optional[Collection[str]] = None,
+        language: str = "nl",
     ) -> list:
         """Analyseer tekst en retourneer een lijst van gevonden entiteiten.
 
@@ -23,3 +38,24 @@ class NLPEngine(ABC):
             list: Lijst van entiteiten (dicts of Presidio RecognizerResult).
         """
         pass
+
+    def analyze_batch(
+        self,
+        texts: Iterable[str],
+        entities: Optional[Collection[str]] = None,
+        language: str = "nl",
+    ) -> list[list]:
+        """Analyseer meerdere teksten en retourneer per tekst de gevonden entiteiten.
+
+        Engines die batching ondersteunen overschrijven deze methode; de
+        standaardimplementatie analyseert de teksten één voor één.
+
+        Args:
+            texts (Iterable[str]): De te analyseren teksten.
+            entities (list, optional): Optionele lijst van te detecteren entiteiten. Defaults to None.
+            language (str, optional): Taalcode. Defaults to 'nl'.
+
+        Returns:
+            list[list]: Per tekst een lijst van entiteiten, in dezelfde volgorde als de invoer.
+        """
+        return [self.analyze(text, entities, language) for text in texts]
@@ -1,5 +1,11 @@
+import logging
+from functools import lru_cache
 from typing import Optional, Union, overload
 
+import spacy
+import torch
+
+from src.api.config import settings
 from src.api.utils.nlp.spacy_engine import SpacyEngine
 from src.api.utils.nlp.transformers_engine import NLPEngine, TransformersEngine
 
@@ -17,6 +23,13 @@ def load_nlp_engine(
 ) -> Union[SpacyEngine, TransformersEngine]:
     """Load the NLP engine based on the provided configuration.
 
+    When ``use_gpu`` is set (in the config or via the ``USE_GPU`` setting) the
+    GPU is activated before the model is loaded, so the whole pipeline stays
+    on the device. ``quantize`` (default from ``TRANSFORMERS_QUANTIZE``) enables
+    dynamic int8 quantization of the transformers model on CPU ("int8") or
+    half precision on GPU ("fp16").
+    Engines are cached per configuration, so repeated calls are cheap.
+
     Args:
         config_dict (dict, optional): model and supplier config. Defaults to None.
 
@@ -28,14 +41,44 @@ def load_nlp_engine(
     """
     if config_dict is None:
         # Default to SpaCy
-        return SpacyEngine()
+        return _load_engine(
+            "spacy", settings.DEFAULT_SPACY_MODEL, settings.USE_GPU, None
+        )
 
     engine_type = config_dict.get("nlp_engine", "spacy")
-    model_name = config_dict.get("model_name", "nl_core_news_md")
+    # Zonder expliciet model het geconfigureerde standaardmodel van die engine
+    model_name = config_dict.get("model_name") or (
+        settings.DEFAULT_TRANSFORMERS_MODEL
+        if engine_type == "transformers"
+        else settings.DEFAULT_SPACY_MODEL
+    )
+    use_gpu = config_dict.get("use_gpu", settings.USE_GPU)
+    quantize = config_dict.get("quantize", settings.TRANSFORMERS_QUANTIZE)
+    return _load_engine(engine_type, model_name, bool(use_gpu), quantize)
+
+
+@lru_cache(maxsize=8)
+def _load_engine(
+    engine_type: str, model_name: str, use_gpu: bool, quantize: Optional[str]
+) -> Union[SpacyEngine, TransformersEngine]:
+    # Gecachet op de genormaliseerde configuratie: hetzelfde model wordt per
+    # proces maar één keer geladen, ook als de config-dict telkens nieuw is.
+    if use_gpu:
+        # De transformers-pipeline draait op torch; spacy.prefer_gpu kijkt naar
+        # CuPy en activeert die voor SpaCy
+        if engine_type == "transformers":
+            gpu_available = torch.cuda.is_available()
+        else:
+            gpu_available = spacy.prefer_gpu()
+        if not gpu_available:
+            logging.warning("GPU requested but not available, falling back to CPU")
+            use_gpu = False
 
     if engine_type == "spacy":
         return SpacyEngine(model_name)
     elif engine_type == "transformers":
-        return TransformersEngine(model_name)
+        return TransformersEngine(
+            model_name, device=0 if use_gpu else -1, quantize=quantize
+        )
     else:
         raise ValueError(f"Onbekende NLP engine: {engine_type}")
@@ -1,28 +1,48 @@
-from typing import List, Optional
+import hashlib
+from typing import Collection, Iterable, Optional, Tuple
 
 import spacy
 
 from src.api.config import settings
-from src.api.utils.nlp.base import NLPEngine
+from src.api.utils.cache import LRUCache
+from src.api.utils.nlp.base import NLPEngine, entity_filter
+
+# (label, start, end, tekst) per entity; tuples zijn onveranderlijk en klein
+_Ents = Tuple[Tuple[str, int, int, str], ...]
+
+# NER-uitvoer per (model, tekst), los van het entity-filter van de aanvraag;
+# dezelfde tekst met andere entities loopt zo niet opnieuw door de pipeline
+_ents_cache: LRUCache[_Ents] = LRUCache(settings.ANALYSIS_CACHE_SIZE)
+
+
+def clear_ents_cache() -> None:
+    """Leeg de cache met NER-uitvoer van SpaCy."""
+    _ents_cache.clear()
 
 
 class SpacyEngine(NLPEngine):
     """Wrapper voor SpaCy NER-engine voor Nederlandse PII-detectie.
 
-    Laadt een opgegeven SpaCy-model en voert entity extractie uit.
+    Laadt een opgegeven SpaCy-model en voert entity extractie uit. Componenten
+    die NER niet nodig heeft (zie `SPACY_DISABLED_COMPONENTS`) worden
+    uitgeschakeld.
     """
 
     def __init__(self, model_name: str = settings.DEFAULT_SPACY_MODEL) -> None:
         self.model_name = model_name
         try:
-            self.nlp: spacy.language.Language = spacy.load(model_name)
+            self.nlp: spacy.language.Language = spacy.load(
+                model_name, exclude=settings.SPACY_DISABLED_COMPONENTS
+            )
         except Exception:
             # Fallback: probeer model on-the-fly te installeren (handig voor staging)
             try:
                 from spacy.cli import download as spacy_download
 
                 spacy_download(model_name)
-                self.nlp = spacy.load(model_name)  # type: ignore[assignment]
+                self.nlp = spacy.load(  # type: ignore[assignment]
+                    model_name, exclude=settings.SPACY_DISABLED_COMPONENTS
+                )
             except Exception as e:  # pragma: no cover
                 raise RuntimeError(
                     f"SpaCy model '{model_name}' kon niet worden geladen/geïnstalleerd: {e}"
@@ -31,7 +51,7 @@ class SpacyEngine(NLPEngine):
     def analyze(
         self,
         text: str,
-        entities: Optional[List] = None,
+        entities: Optional[Collection[str]] = None,
         language: str = settings.DEFAULT_LANGUAGE,
     ) -> list:
         """Voer analyse uit op de tekst met behulp van SpaCy.
@@ -44,17 +64,69 @@ class SpacyEngine(NLPEngine):
         Returns:
             list: een lijst van dictionaries met de resultaten van de analyse.
         """
-        doc = self.nlp(text)
+        key = self._cache_key(text)
+        ents = _ents_cache.get(key)
+        if ents is None:
+            ents = self._doc_ents(self.nlp(text))
+            _ents_cache.put(key, ents)
+        return self._ents_to_results(ents, entity_filter(entities))
+
+    def analyze_batch(
+        self,
+        texts: Iterable[str],
+        entities: Optional[Collection[str]] = None,
+        language: str = settings.DEFAULT_LANGUAGE,
+    ) -> list[list]:
+        """Voer analyse uit op meerdere teksten in één `nlp.pipe`-aanroep.
+
+        Args:
+            texts (Iterable[str]): de teksten die geanalyseerd moeten worden.
+            entities (list, optional): de entities om terug te geven in de results. Defaults to None.
+            language (str, optional): taal om te analyseren. Defaults to settings.DEFAULT_LANGUAGE.
+
+        Returns:
+            list[list]: per tekst een lijst van dictionaries met de resultaten.
+        """
+        texts = list(texts)
+        keys = [self._cache_key(text) for text in texts]
+        cached = [_ents_cache.get(key) for key in keys]
+        # Alleen teksten die nog niet in de cache staan gaan door de pipeline
+        missing = [index for index, ents in enumerate(cached) if ents is None]
+        docs = self.nlp.pipe(
+            (texts[index] for index in missing),
+            batch_size=settings.NLP_BATCH_SIZE,
+            n_process=settings.NLP_N_PROCESS,
+        )
+        for index, doc in zip(missing, docs):
+            cached[index] = self._doc_ents(doc)
+            _ents_cache.put(keys[index], cached[index])
+        wanted = entity_filter(entities)
+        return [self._ents_to_results(ents or (), wanted) for ents in cached]
+
+    def _cache_key(self, text: str) -> tuple:
+        return (
+            self.model_name,
+            hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(),
+        )
+
+    @staticmethod
+    def _doc_ents(doc: spacy.tokens.Doc) -> _Ents:
+        return tuple(
+            (ent.label_, ent.start_char, ent.end_char, ent.text) for ent in doc.ents
+        )
+
+    @staticmethod
+    def _ents_to_results(ents: _Ents, entities: Optional[Collection[str]]) -> list:
         results = []
-        for ent in doc.ents:
-            if entities is None or ent.label_ in entities:
+        for label, start, end, text in ents:
+            if entities is None or label in entities:
                 results.append(
                     {
-                        "entity_type": ent.label_,
-                        "start": ent.start_char,
-                        "end": ent.end_char,
+                        "entity_type": label,
+                        "start": start,
+                        "end": end,
                         "score": "",  # SpaCy geeft geen scores, default lege string
-                        "text": ent.text,
+                        "text": text,
                     }
                 )
         return results
@@ -1,6 +1,69 @@
-from typing import List, Optional
+import string
+from functools import lru_cache
+from operator import mul
+from typing import Dict, List, Optional, Tuple
+
+import regex
+from presidio_analyzer import (
+    EntityRecognizer,
+    Pattern,
+    PatternRecognizer,
+    RecognizerResult,
+)
+from presidio_analyzer.nlp_engine import NlpArtifacts
+
+# Zelfde vlaggen en timeout als Presidio's PatternRecognizer
+_DEFAULT_REGEX_FLAGS = regex.DOTALL | regex.MULTILINE | regex.IGNORECASE
+_REGEX_TIMEOUT_SECONDS = 60
+
+
+def _precompiled(pattern: Pattern) -> Pattern:
+    """Compileer de regex van een patroon vooraf met Presidio's standaardvlaggen.
+
+    Presidio compileert een patroon pas bij de eerste `analyze` en alleen voor
+    die ene instantie. Door dit bij het importeren te doen en de `Pattern`
+    objecten te delen, gebeurt het één keer per proces.
+    """
+    pattern.compiled_regex = regex.compile(pattern.regex, _DEFAULT_REGEX_FLAGS)
+    pattern.compiled_with_flags = _DEFAULT_REGEX_FLAGS
+    return pattern
+
+
+_PHONE_PATTERNS = [
+    _precompiled(
+        Pattern("DUTCH_PHONE", r"\b(?:0|(?:\+|00)31)[- ]?(?:\d[- ]?){9}\b", 0.6)
+    )
+]
+
+_IBAN_PATTERNS = [
+    # Specifiek NL-patroon met of zonder spaties
+    _precompiled(
+        Pattern(
+            "DUTCH_IBAN",
+            r"\bNL\d{2}\s?[A-Z]{4}(?:\s?\d{10}|\s?\d{4}\s?\d{4}\s?\d{2})\b",
+            0.6,
+        )
+    ),
+    # Algemeen internationaal IBAN-patroon (min 15, max 34 tekens), met optionele spaties
+    # Landcode (2 letters) + controlegetal (2 cijfers) + BBAN (alfa-numeriek)
+    _precompiled(
+        Pattern(
+            "INTL_IBAN",
+            r"\b[A-Z]{2}\d{2}(?:\s?[A-Z0-9]{4}){2,7}(?:\s?[A-Z0-9]{1,4})?\b",
+            0.55,
+        )
+    ),
+]
 
-from presidio_analyzer import Pattern, PatternRecognizer
+_EMAIL_PATTERNS = [
+    _precompiled(
+        Pattern(
+            "EMAIL_ADDRESS",
+            r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
+            0.6,
+        )
+    )
+]
 
 
 class DutchPhoneNumberRecognizer(PatternRecognizer):
@@ -14,22 +77,36 @@ class DutchPhoneNumberRecognizer(PatternRecognizer):
         context: Optional[List[str]] = None,
         supported_language: str = "nl",
     ) -> None:
-        patterns = [
-            Pattern("DUTCH_PHONE", r"\b(?:0|(?:\+|00)31)[- ]?(?:\d[- ]?){9}\b", 0.6)
-        ]
         super().__init__(
             supported_entity="PHONE_NUMBER",
-            patterns=patterns,
+            patterns=list(_PHONE_PATTERNS),
             context=context,  # type: ignore[arg-type]
             supported_language=supported_language,
         )
 
 
+# IBAN-controle: letters tellen als 10 (A) t/m 35 (Z), in één translate-doorloop
+_IBAN_LETTER_DIGITS = str.maketrans(
+    {c: str(i) for i, c in enumerate(string.ascii_uppercase, start=10)}
+)
+_IBAN_SEPARATORS = str.maketrans("", "", " ")
+
+
+def _is_valid_iban(iban: str) -> bool:
+    """Controleer het controlegetal van een IBAN (ISO 13616, mod 97)."""
+    compact = iban.translate(_IBAN_SEPARATORS).upper()
+    if not (15 <= len(compact) <= 34 and compact.isascii() and compact.isalnum()):
+        return False
+    rearranged = compact[4:] + compact[:4]
+    return int(rearranged.translate(_IBAN_LETTER_DIGITS)) % 97 == 1
+
+
 class DutchIBANRecognizer(PatternRecognizer):
     """Herkenner voor IBAN bankrekeningnummers.
 
     Ondersteunt Nederlandse IBANs (beginnend met 'NL') en internationale IBANs,
-    in zowel aaneengesloten als gespatieerde vormen.
+    in zowel aaneengesloten als gespatieerde vormen. Matches met een ongeldig
+    controlegetal worden verworpen.
     """
 
     def __init__(
@@ -37,28 +114,17 @@ class DutchIBANRecognizer(PatternRecognizer):
         context: Optional[List[str]] = None,
         supported_language: str = "nl",
     ) -> None:
-        patterns = [
-            # Specifiek NL-patroon met of zonder spaties
-            Pattern(
-                "DUTCH_IBAN",
-                r"\bNL\d{2}\s?[A-Z]{4}(?:\s?\d{10}|\s?\d{4}\s?\d{4}\s?\d{2})\b",
-                0.6,
-            ),
-            # Algemeen internationaal IBAN-patroon (min 15, max 34 tekens), met optionele spaties
-            # Landcode (2 letters) + controlegetal (2 cijfers) + BBAN (alfa-numeriek)
-            Pattern(
-                "INTL_IBAN",
-                r"\b[A-Z]{2}\d{2}(?:\s?[A-Z0-9]{4}){2,7}(?:\s?[A-Z0-9]{1,4})?\b",
-                0.55,
-            ),
-        ]
         super().__init__(
             supported_entity="IBAN",
-            patterns=patterns,
+            patterns=list(_IBAN_PATTERNS),
             context=context,  # type: ignore[arg-type]
             supported_language=supported_language,
         )
 
+    def validate_result(self, pattern_text: str) -> Optional[bool]:
+        """Valideer een match met de mod-97-controle van het IBAN."""
+        return _is_valid_iban(pattern_text)
+
 
 class EmailRecognizer(PatternRecognizer):
     """Herkenner voor e-mailadressen volgens het standaard e-mailpatroon."""
@@ -68,90 +134,118 @@ class EmailRecognizer(PatternRecognizer):
         context: Optional[List[str]] = None,
         supported_language: str = "nl",
     ) -> None:
-        patterns = [
-            Pattern(
-                "EMAIL_ADDRESS",
-                r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
-                0.6,
-            )
-        ]
         super().__init__(
             supported_entity="EMAIL",
-            patterns=patterns,
+            patterns=list(_EMAIL_PATTERNS),
             context=context,  # type: ignore[arg-type]
             supported_language=supported_language,
         )
 
 
+_BSN_SEPARATORS = b" -"
+_BSN_WEIGHTS = (9, 8, 7, 6, 5, 4, 3, 2, -1)
+
+
+_BSN_PATTERNS = [
+    _precompiled(Pattern("NL_BSN", r"\b(?:\d{9}|\d{3}[- ]?\d{3}[- ]?\d{3})\b", 0.6))
+]
+
+
 class DutchBSNRecognizer(PatternRecognizer):
     def __init__(self, context: Optional[List[str]] = None) -> None:
-        pattern = Pattern(
-            "NL_BSN",
-            r"\b(?:\d{9}|\d{3}[- ]?\d{3}[- ]?\d{3})\b",
-            0.6,
-        )
         super().__init__(
             supported_entity="BSN",
-            patterns=[pattern],
+            patterns=list(_BSN_PATTERNS),
             context=context,  # type: ignore[arg-type]
             supported_language="nl",
         )
 
     def _is_valid_bsn(self, bsn: str) -> bool:
-        digits = [int(d) for d in bsn if d.isdigit()]
-        return sum((9 - i) * d for i, d in enumerate(digits)) % 11 == 0
+        """Controleer een BSN met de elfproef (gewichten 9 t/m 2 en -1)."""
+        # Op byteniveau: bytes.isdigit kent alleen ASCII-cijfers, en andere
+        # tekens worden '?' zodat ze de controle niet kunnen omzeilen
+        digits = bsn.encode("ascii", "replace").translate(None, _BSN_SEPARATORS)
+        if len(digits) != 9 or not digits.isdigit():
+            return False
+        # Rekenen op de ASCII-codes scheelt een int() per cijfer; de offset
+        # van '0' (48) telt met de som van de gewichten (43) mee
+        total = sum(map(mul, digits, _BSN_WEIGHTS)) - 48 * 43
+        return total % 11 == 0
+
+    def validate_result(self, pattern_text: str) -> Optional[bool]:
+        """Valideer een match met de elfproef van het BSN."""
+        return self._is_valid_bsn(pattern_text)
+
+
+_POSTCODE_PATTERNS = [
+    _precompiled(Pattern("NL_POSTCODE", r"\b\d{4}\s?[A-Z]{2}\b", 0.55))
+]
+
 
 class DutchPostcodeRecognizer(PatternRecognizer):
     def __init__(
         self, context: Optional[List[str]] = None, supported_language: str = "nl"
     ) -> None:
-        pattern = Pattern("NL_POSTCODE", r"\b\d{4}\s?[A-Z]{2}\b", 0.55)
         super().__init__(
             "POSTCODE",
-            patterns=[pattern],
+            patterns=list(_POSTCODE_PATTERNS),
             context=context,  # type: ignore[arg-type]
             supported_language=supported_language,
         )
 
 
 # BTW-/VAT-nummer (NL999999999B99 – nieuw formaat)
+_VAT_PATTERNS = [_precompiled(Pattern("NL_VAT", r"\bNL\d{9}B\d{2}\b", 0.6))]
+
+
 class DutchVATRecognizer(PatternRecognizer):
     def __init__(
         self, context: Optional[List[str]] = None, supported_language: str = "nl"
     ) -> None:
-        pattern = Pattern("NL_VAT", r"\bNL\d{9}B\d{2}\b", 0.6)
         super().__init__(
             "VAT_NUMBER",
-            patterns=[pattern],
+            patterns=list(_VAT_PATTERNS),
             context=context,  # type: ignore[arg-type]
             supported_language=supported_language,
         )
 
 
-# KvK-nummer (8 cijfers in Handelsregister)
+# KvK-nummer (8 cijfers in Handelsregister). Het patroon heeft geen vaste
+# letterlijke prefix; de regex-engine slaat niet-cijfers al goedkoop over, dus
+# een aparte cijfer-voorfilter levert niets op.
+_KVK_PATTERNS = [
+    _precompiled(
+        Pattern("KVK_8_DIGIT", r"\b\d{8}\b", 0.45)  # raise score with context
+    )
+]
+
+
 class DutchKvKRecognizer(PatternRecognizer):
     def __init__(
         self, context: Optional[List[str]] = None, supported_language: str = "nl"
     ) -> None:
-        patterns = [
-            Pattern("KVK_8_DIGIT", r"\b\d{8}\b", 0.45)  # raise score with context
-        ]
         super().__init__(
             "KVK_NUMBER",
-            patterns=patterns,
+            patterns=list(_KVK_PATTERNS),
             context=context,  # type: ignore[arg-type]
             supported_language=supported_language,
         )
 
 
-# Nederlands kenteken (6 posities, diverse combinaties)
+# Nederlands kenteken (6 posities, diverse combinaties). Elk kenteken is
+# XX-XX-XX met per groep twee letters of twee cijfers; alleen cijfers of alleen
+# letters komt niet voor. Dat is één patroon in plaats van zes alternatieven
+# die op elke woordgrens opnieuw geprobeerd worden.
+_LICENSE_GROUP = r"(?:[A-Z]{2}|\d{2})"
 _LICENSE_PATTERNS = [
-    r"[A-Z]{2}-\d{2}-\d{2}",
-    r"\d{2}-\d{2}-[A-Z]{2}",
-    r"\d{2}-[A-Z]{2}-\d{2}",
-    r"[A-Z]{2}-\d{2}-[A-Z]{2}",
-    r"[A-Z]{2}-[A-Z]{2}-\d{2}",
-    r"\d{2}-[A-Z]{2}-[A-Z]{2}",
+    _precompiled(
+        Pattern(
+            "NL_PLATE",
+            r"\b(?!\d{2}-\d{2}-\d{2}\b|[A-Z]{2}-[A-Z]{2}-[A-Z]{2}\b)"
+            rf"{_LICENSE_GROUP}-{_LICENSE_GROUP}-{_LICENSE_GROUP}\b",
+            0.5,
+        )
+    )
 ]
 
 
@@ -159,78 +253,102 @@ class DutchLicensePlateRecognizer(PatternRecognizer):
     def __init__(
         self, context: Optional[List[str]] = None, supported_language: str = "nl"
     ) -> None:
-        pattern = Pattern("NL_PLATE", rf"\b(?:{'|'.join(_LICENSE_PATTERNS)})\b", 0.5)
         super().__init__(
             "LICENSE_PLATE",
-            patterns=[pattern],
+            patterns=list(_LICENSE_PATTERNS),
             context=context,  # type: ignore[arg-type]
             supported_language=supported_language,
         )
 
 
+# Eén octet (0-255, zonder voorloopnullen)
+_IPV4_OCTET = r"(?:25[0-5]|2[0-4]\d|1\d{2}|[1-9]?\d)"
+_IPV4_PATTERNS = [
+    _precompiled(Pattern("IPV4", rf"\b{_IPV4_OCTET}(?:\.{_IPV4_OCTET}){{3}}\b", 0.5))
+]
+
+
 # Taal-onafhankelijke IPv4-adres-herkenner
 class IPv4Recognizer(PatternRecognizer):
     def __init__(
         self, context: Optional[List[str]] = None, supported_language: str = "any"
     ) -> None:
-        pattern = Pattern(
-            "IPV4",
-            r"\b(?:25[0-5]|2[0-4]\d|1\d{2}|[1-9]?\d)"
-            r"(?:\.(?:25[0-5]|2[0-4]\d|1\d{2}|[1-9]?\d)){3}\b",
-            0.5,
-        )
         super().__init__(
             "IP_ADDRESS",
-            patterns=[pattern],
+            patterns=list(_IPV4_PATTERNS),
             context=context,  # type: ignore[arg-type]
             supported_language=supported_language,
         )
 
 
+_DATE_PATTERNS = [
+    _precompiled(p)
+    for p in (
+        # dd-mm-yyyy, dd/mm/yyyy, dd.mm.yyyy
+        Pattern(
+            "DATE_DD_MM_YYYY",
+            r"\b(?:0?[1-9]|[12][0-9]|3[01])[\-/.](?:0?[1-9]|1[0-2])[\-/.](?:19|20)\d{2}\b",
+            0.5,
+        ),
+        # mm-dd-yyyy, mm/dd/yyyy, mm.dd.yyyy
+        Pattern(
+            "DATE_MM_DD_YYYY",
+            r"\b(?:0?[1-9]|1[0-2])[\-/.](?:0?[1-9]|[12][0-9]|3[01])[\-/.](?:19|20)\d{2}\b",
+            0.5,
+        ),
+        # yyyy-mm-dd
+        Pattern(
+            "DATE_YYYY_MM_DD",
+            r"\b(?:19|20)\d{2}[\-/.](?:0?[1-9]|1[0-2])[\-/.](?:0?[1-9]|[12][0-9]|3[01])\b",
+            0.5,
+        ),
+        # dd mm yy (space-separated, 2-digit year)
+        Pattern(
+            "DATE_DD_MM_YY",
+            r"\b(?:0?[1-9]|[12][0-9]|3[01])[\s/.-](?:0?[1-9]|1[0-2])[\s/.-]\d{2}\b",
+            0.45,
+        ),
+        # 1 september 2020 (spelled-out months in Dutch, case-insensitive)
+        Pattern(
+            "DATE_DD_MONTH_YYYY",
+            r"(?i)\b(?:0?[1-9]|[12][0-9]|3[01])\s+(?:januari|februari|maart|april|mei|juni|juli|augustus|september|oktober|november|december)\s+(?:19|20)\d{2}\b",
+            0.5,
+        ),
+    )
+]
+
+
 class DutchDateRecognizer(PatternRecognizer):
     def __init__(
         self, context: Optional[List[str]] = None, supported_language: str = "nl"
     ) -> None:
-        patterns = [
-            # dd-mm-yyyy, dd/mm/yyyy, dd.mm.yyyy
-            Pattern(
-                "DATE_DD_MM_YYYY",
-                r"\b(?:0?[1-9]|[12][0-9]|3[01])[\-/.](?:0?[1-9]|1[0-2])[\-/.](?:19|20)\d{2}\b",
-                0.5,
-            ),
-            # mm-dd-yyyy, mm/dd/yyyy, mm.dd.yyyy
-            Pattern(
-                "DATE_MM_DD_YYYY",
-                r"\b(?:0?[1-9]|1[0-2])[\-/.](?:0?[1-9]|[12][0-9]|3[01])[\-/.](?:19|20)\d{2}\b",
-                0.5,
-            ),
-            # yyyy-mm-dd
-            Pattern(
-                "DATE_YYYY_MM_DD",
-                r"\b(?:19|20)\d{2}[\-/.](?:0?[1-9]|1[0-2])[\-/.](?:0?[1-9]|[12][0-9]|3[01])\b",
-                0.5,
-            ),
-            # dd mm yy (space-separated, 2-digit year)
-            Pattern(
-                "DATE_DD_MM_YY",
-                r"\b(?:0?[1-9]|[12][0-9]|3[01])[\s/.-](?:0?[1-9]|1[0-2])[\s/.-]\d{2}\b",
-                0.45,
-            ),
-            # 1 september 2020 (spelled-out months in Dutch, case-insensitive)
-            Pattern(
-                "DATE_DD_MONTH_YYYY",
-                r"(?i)\b(?:0?[1-9]|[12][0-9]|3[01])\s+(?:januari|februari|maart|april|mei|juni|juli|augustus|september|oktober|november|december)\s+(?:19|20)\d{2}\b",
-                0.5,
-            ),
-        ]
         super().__init__(
             supported_entity="DATE_TIME",
-            patterns=patterns,
+            patterns=list(_DATE_PATTERNS),
             context=context,  # type: ignore[arg-type]
             supported_language=supported_language,
         )
 
 
+_PASSPORT_PATTERNS = [
+    _precompiled(p)
+    for p in (
+        # Oud formaat: letters zonder 'O', pos 3-8 letters/cijfers (0-9), pos 9 cijfer (0-9)
+        Pattern(
+            "NL_DOC_OLD",
+            r"\b[A-NP-Z]{2}[A-NP-Z0-9]{6}\d\b",
+            0.55,
+        ),
+        # Nieuw formaat: geen '0' meer; cijfers 1-9, pos 9 ook 1-9
+        Pattern(
+            "NL_DOC_NEW",
+            r"\b[A-NP-Z]{2}(?:[A-NP-Z]|[1-9]){6}[1-9]\b",
+            0.6,
+        ),
+    )
+]
+
+
 class DutchPassportIdRecognizer(PatternRecognizer):
     """Herkenner voor Nederlandse paspoort-/identiteitskaartnummers.
 
@@ -247,28 +365,87 @@ class DutchPassportIdRecognizer(PatternRecognizer):
     def __init__(
         self, context: Optional[List[str]] = None, supported_language: str = "nl"
     ) -> None:
-        patterns = [
-            # Oud formaat: letters zonder 'O', pos 3-8 letters/cijfers (0-9), pos 9 cijfer (0-9)
-            Pattern(
-                "NL_DOC_OLD",
-                r"\b[A-NP-Z]{2}[A-NP-Z0-9]{6}\d\b",
-                0.55,
-            ),
-            # Nieuw formaat: geen '0' meer; cijfers 1-9, pos 9 ook 1-9
-            Pattern(
-                "NL_DOC_NEW",
-                r"\b[A-NP-Z]{2}(?:[A-NP-Z]|[1-9]){6}[1-9]\b",
-                0.6,
-            ),
-        ]
         super().__init__(
             supported_entity="ID_NO",
-            patterns=patterns,
+            patterns=list(_PASSPORT_PATTERNS),
             context=context,  # type: ignore[arg-type]
             supported_language=supported_language,
         )
 
 
+_CASE_NUMBER_PATTERNS = [
+    _precompiled(p)
+    for p in (
+        # Z-YYYY-999999 (Z-jaar-nummer), ook permissief met '-' of '/'
+        Pattern(
+            "CASE_Z",
+            r"\bZ[-\/]?\d{4}[-\/]?\d{4,6}\b",
+            0.55,
+        ),
+        # WOO/BEZWAAR/INT/VTH/WP-YYYY-999 (of langer)
+        Pattern(
+            "CASE_PREFIXED",
+            r"\b(?:WOO|BEZWAAR|INT|VTH|WP)[-\/]?\d{4}[-\/]?\d{3,6}\b",
+            0.6,
+        ),
+        # Algemeen Jaar-Nummer (risico op false positives, lagere score)
+        Pattern(
+            "CASE_YEAR_NUMBER",
+            r"\b\d{4}[-\/]\d{4,6}\b",
+            0.45,
+        ),
+        # BAG ID, exact 16 cijfers (lager vertrouwen want generiek)
+        Pattern(
+            "CASE_BAG_ID",
+            r"\b\d{16}\b",
+            0.4,
+        ),
+        # UUID-stijl Zaak-ID (case-insensitive hex)
+        Pattern(
+            "CASE_UUID",
+            r"(?i)\b[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}\b",
+            0.6,
+        ),
+        # Civiel: C/XX/NNNNNN (meer digits toegestaan)
+        Pattern(
+            "CASE_C_CIVIL",
+            r"\bC\/\d{2}\/\d{5,8}\b",
+            0.55,
+        ),
+        # Bestuurlijk: AWB 21/12345
+        Pattern(
+            "CASE_AWB",
+            r"\bAWB\s?\d{2}\/\d{3,6}\b",
+            0.6,
+        ),
+        # Hoge Raad: HR 21/00123
+        Pattern(
+            "CASE_HR",
+            r"\bHR\s?\d{2}\/\d{5}\b",
+            0.6,
+        ),
+        # Gerechtshof: 200.12345
+        Pattern(
+            "CASE_GERECHTSHOF",
+            r"\b200\.\d{5}\b",
+            0.55,
+        ),
+        # Strafzaak OM: 08/123456-89
+        Pattern(
+            "CASE_OM",
+            r"\b\d{2}\/\d{6}-\d{2}\b",
+            0.6,
+        ),
+        # Algemeen: RBAMS 21/12345 (of andere rechtbankcodes 4-5 letters)
+        Pattern(
+            "CASE_COURT_GENERIC",
+            r"\b[A-Z]{4,5}\s?\d{2}\/\d{3,6}\b",
+            0.55,
+        ),
+    )
+]
+
+
 class CaseNumberRecognizer(PatternRecognizer):
     """Herkenner voor diverse (rechts)zaak- en dossiernummers.
 
@@ -279,82 +456,19 @@ class CaseNumberRecognizer(PatternRecognizer):
     def __init__(
         self, context: Optional[List[str]] = None, supported_language: str = "nl"
     ) -> None:
-        patterns = [
-            # Z-YYYY-999999 (Z-jaar-nummer), ook permissief met '-' of '/'
-            Pattern(
-                "CASE_Z",
-                r"\bZ[-\/]?\d{4}[-\/]?\d{4,6}\b",
-                0.55,
-            ),
-            # WOO/BEZWAAR/INT/VTH/WP-YYYY-999 (of langer)
-            Pattern(
-                "CASE_PREFIXED",
-                r"\b(?:WOO|BEZWAAR|INT|VTH|WP)[-\/]?\d{4}[-\/]?\d{3,6}\b",
-                0.6,
-            ),
-            # Algemeen Jaar-Nummer (risico op false positives, lagere score)
-            Pattern(
-                "CASE_YEAR_NUMBER",
-                r"\b\d{4}[-\/]\d{4,6}\b",
-                0.45,
-            ),
-            # BAG ID, exact 16 cijfers (lager vertrouwen want generiek)
-            Pattern(
-                "CASE_BAG_ID",
-                r"\b\d{16}\b",
-                0.4,
-            ),
-            # UUID-stijl Zaak-ID (case-insensitive hex)
-            Pattern(
-                "CASE_UUID",
-                r"(?i)\b[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}\b",
-                0.6,
-            ),
-            # Civiel: C/XX/NNNNNN (meer digits toegestaan)
-            Pattern(
-                "CASE_C_CIVIL",
-                r"\bC\/\d{2}\/\d{5,8}\b",
-                0.55,
-            ),
-            # Bestuurlijk: AWB 21/12345
-            Pattern(
-                "CASE_AWB",
-                r"\bAWB\s?\d{2}\/\d{3,6}\b",
-                0.6,
-            ),
-            # Hoge Raad: HR 21/00123
-            Pattern(
-                "CASE_HR",
-                r"\bHR\s?\d{2}\/\d{5}\b",
-                0.6,
-            ),
-            # Gerechtshof: 200.12345
-            Pattern(
-                "CASE_GERECHTSHOF",
-                r"\b200\.\d{5}\b",
-                0.55,
-            ),
-            # Strafzaak OM: 08/123456-89
-            Pattern(
-                "CASE_OM",
-                r"\b\d{2}\/\d{6}-\d{2}\b",
-                0.6,
-            ),
-            # Algemeen: RBAMS 21/12345 (of andere rechtbankcodes 4-5 letters)
-            Pattern(
-                "CASE_COURT_GENERIC",
-                r"\b[A-Z]{4,5}\s?\d{2}\/\d{3,6}\b",
-                0.55,
-            ),
-        ]
         super().__init__(
             supported_entity="CASE_NO",
-            patterns=patterns,
+            patterns=list(_CASE_NUMBER_PATTERNS),
             context=context,  # type: ignore[arg-type]
             supported_language=supported_language,
         )
 
 
+_DRIVERS_LICENSE_PATTERNS = [
+    _precompiled(Pattern("NL_DRIVERS_LICENSE", r"\b\d{10}\b", 0.45))
+]
+
+
 class DutchDriversLicenseRecognizer(PatternRecognizer):
     """Herkenner voor Nederlands rijbewijsnummer (10 cijfers).
 
@@ -365,16 +479,146 @@ class DutchDriversLicenseRecognizer(PatternRecognizer):
     def __init__(
         self, context: Optional[List[str]] = None, supported_language: str = "nl"
     ) -> None:
-        patterns = [
-            Pattern(
-                "NL_DRIVERS_LICENSE",
-                r"\b\d{10}\b",
-                0.45,
-            )
-        ]
         super().__init__(
             supported_entity="DRIVERS_LICENSE",
-            patterns=patterns,
+            patterns=list(_DRIVERS_LICENSE_PATTERNS),
             context=context,  # type: ignore[arg-type]
             supported_language=supported_language,
         )
+
+
+class MultiPatternRecognizer(EntityRecognizer):
+    """Combineert de patronen van meerdere pattern recognizers in één regex.
+
+    Alle patronen worden als alternatieven met een benoemde groep in één
+    gecompileerde regex gezet, zodat de tekst in één doorloop wordt gescand in
+    plaats van één doorloop per patroon. Bij matches op dezelfde positie wint
+    het eerste patroon: de recognizers in de opgegeven volgorde, en binnen een
+    recognizer het patroon met de hoogste score. Zet specifiekere recognizers
+    dus eerst. `validate_result`/`invalidate_result` van de oorspronkelijke
+    recognizer worden gewoon toegepast.
+
+    Met `required_literals` kan per entiteit een letterlijke tekst worden
+    opgegeven die in elke match voorkomt (bijv. "@" voor e-mail). Ontbreekt
+    die in de tekst, dan worden de patronen van die entiteit niet eens
+    geprobeerd; zo'n substring-check is veel goedkoper dan het patroon op elke
+    woordgrens laten falen.
+    """
+
+    def __init__(
+        self,
+        recognizers: List[PatternRecognizer],
+        supported_language: str = "nl",
+        name: Optional[str] = None,
+        required_literals: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self._groups: Dict[str, Tuple[PatternRecognizer, Pattern]] = {}
+        self._alternatives: List[Tuple[str, str]] = []
+        for recognizer in recognizers:
+            for pattern in sorted(recognizer.patterns, key=lambda p: -p.score):
+                group = f"p{len(self._groups)}"
+                self._groups[group] = (recognizer, pattern)
+                self._alternatives.append(
+                    (
+                        recognizer.supported_entities[0],
+                        f"(?P<{group}>{_strip_inline_flags(pattern.regex)})",
+                    )
+                )
+        self._regex = _compile_alternation(
+            "|".join(alternative for _, alternative in self._alternatives)
+        )
+        self._required_literals = required_literals or {}
+
+        supported_entities = list(
+            dict.fromkeys(r.supported_entities[0] for r in recognizers)
+        )
+        super().__init__(
+            supported_entities=supported_entities,
+            name=name,
+            supported_language=supported_language,
+        )
+
+    def load(self) -> None:
+        """Niets te laden; de regex wordt in `__init__` opgehaald."""
+        pass
+
+    def analyze(
+        self,
+        text: str,
+        entities: List[str],
+        nlp_artifacts: Optional[NlpArtifacts] = None,
+    ) -> List[RecognizerResult]:
+        """Scan de tekst in één doorloop op alle patronen.
+
+        Args:
+            text (str): de te analyseren tekst.
+            entities (List[str]): entiteiten om terug te geven; leeg of None is alles.
+            nlp_artifacts (NlpArtifacts, optional): niet gebruikt.
+
+        Returns:
+            List[RecognizerResult]: de gevonden entiteiten.
+        """
+        skipped = {
+            entity
+            for entity, literal in self._required_literals.items()
+            if literal not in text
+        }
+        compiled = self._regex
+        if skipped:
+            alternatives = [
+                alternative
+                for entity, alternative in self._alternatives
+                if entity not in skipped
+            ]
+            if not alternatives:
+                return []
+            compiled = _compile_alternation("|".join(alternatives))
+
+        results = []
+        # concurrent=True geeft de GIL vrij tijdens het matchen, zodat de NLP-analyse
+        # die tegelijk in een andere thread draait niet op de regex hoeft te wachten
+        matches = compiled.finditer(
+            text, timeout=_REGEX_TIMEOUT_SECONDS, concurrent=True
+        )
+        for match in matches:
+            start, end = match.span()
+            if start == end:
+                continue
+            recognizer, pattern = self._groups[match.lastgroup]
+            entity_type = recognizer.supported_entities[0]
+            if entities and entity_type not in entities:
+                continue
+
+            score = pattern.score
+            current_match = text[start:end]
+            validation_result = recognizer.validate_result(current_match)
+            if validation_result is not None:
+                score = self.MAX_SCORE if validation_result else self.MIN_SCORE
+            if recognizer.invalidate_result(current_match):
+                score = self.MIN_SCORE
+            if score > self.MIN_SCORE:
+                results.append(
+                    RecognizerResult(
+                        entity_type=entity_type,
+                        start=start,
+                        end=end,
+                        score=score,
+                        recognition_metadata={
+                            RecognizerResult.RECOGNIZER_NAME_KEY: self.name,
+                            RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: self.id,
+                        },
+                    )
+                )
+        return results
+
+
+@lru_cache(maxsize=16)
+def _compile_alternation(pattern: str) -> "regex.Pattern[str]":
+    # Gedeeld per proces: nieuwe instanties met dezelfde patronen compileren niet opnieuw
+    return regex.compile(pattern, _DEFAULT_REGEX_FLAGS)
+
+
+def _strip_inline_flags(pattern: str) -> str:
+    # Globale inline-vlaggen mogen alleen aan het begin van de volledige regex staan;
+    # (?i) is overbodig omdat IGNORECASE al standaard aan staat.
+    return pattern[4:] if pattern.startswith("(?i)") else pattern
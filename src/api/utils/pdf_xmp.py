@@ -1,24 +1,29 @@
 import hashlib
-import json
 import logging
 import os
 import re
+import shutil
 import uuid
 import xml.sax.saxutils as saxutils
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
+import orjson
 import pikepdf
 import pymupdf
 from fastapi import BackgroundTasks, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from src.api import database
-from src.api.crud import create_document, create_tag
+from src.api.config import settings
+from src.api.crud import commit_session, create_document, create_tag
 from src.api.dtos import DocumentAnonymizationRequest, DocumentDto, DocumentTagDto
 from src.api.services.text_analyzer import ModularTextAnalyzer
+from src.api.utils.cache import LRUCache
 from src.api.utils.crypto import (
     aes_gcm_decrypt as decrypt_entity,
 )
@@ -36,8 +41,39 @@ _DEFAULT_ENTITY_MASK = {
     "phone": "[PHONE]",
 }
 
+# Same flags page.search_for uses when it builds its own TextPage
+_SEARCH_FLAGS = (
+    pymupdf.TEXT_DEHYPHENATE
+    | pymupdf.TEXT_PRESERVE_WHITESPACE
+    | pymupdf.TEXT_PRESERVE_LIGATURES
+    | pymupdf.TEXT_MEDIABOX_CLIP
+)
+
+# XMP extraction patterns, compiled once at import
+_CDATA_PATTERNS = [
+    re.compile(
+        r"<custom:AnnotationData><!\[CDATA\[(.*?)\]\]></custom:AnnotationData>",
+        re.DOTALL,
+    ),
+    re.compile(
+        r"<custom:AnnotationData>\s*<!\[CDATA\[(.*?)\]\]>\s*</custom:AnnotationData>",
+        re.DOTALL,
+    ),
+    # Non-CDATA version
+    re.compile(r"<custom:AnnotationData>(.*?)</custom:AnnotationData>", re.DOTALL),
+]
+_ANNOTATION_ATTR_RE = re.compile(r'custom:AnnotationData="([^"]*)"')
+_DESCRIPTION_TAG_RE = re.compile(r"<rdf:Description([^>]*)/>", re.DOTALL)
+_CUSTOM_PROP_RE = re.compile(r"custom:([A-Za-z]+)=\"([^\"]*)\"")
+_OCCURRENCES_JSON_RE = re.compile(r'\{"occurrences":\s*\[(.*?)\]\}', re.DOTALL)
+
 logger = logging.getLogger(__name__)
 
+# Entities per source PDF, keyed by path, size and mtime so a changed file is
+# analyzed again; saves re-running the analyzer for repeated metadata calls
+_PDF_ENTITIES_CACHE_SIZE = 256
+_pdf_entities_cache: LRUCache[tuple] = LRUCache(_PDF_ENTITIES_CACHE_SIZE)
+
 
 class _Occurrence(dict):
     """Typed helper for a single PII occurrence."""
@@ -51,7 +87,7 @@ class _Occurrence(dict):
     fingerprint: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AnalysisAnonymizationResponse:
     selected_entities: list[dict]
     output_path: Path
@@ -74,21 +110,36 @@ def save_document_and_cleanup(
     return background
 
 
+@lru_cache(maxsize=8)
+def _derive_key(key: str) -> bytes:
+    """AES key derived from the configured key; the key is static, so hash it once."""
+    return hashlib.sha256(key.encode()).digest()
+
+
+@lru_cache(maxsize=8)
+def _key_fingerprint(key: str) -> str:
+    return get_fingerprint(data=key)
+
+
 def process_anonymized_pdf_to_deanonymize(
     anon_path: Path, key: str
 ) -> pymupdf.Document:
-    hashed_key = hashlib.sha256(key.encode()).digest()
+    hashed_key = _derive_key(key)
 
-    annotations = extract_annotations(str(anon_path), decryption_key=hashed_key)
-    print(f"Extracted {annotations=} from the PDF")
+    # Open the PDF once: PyMuPDF reads the XMP natively and does the redactions
+    doc = pymupdf.open(str(anon_path))
+    annotations = extract_annotations(
+        str(anon_path), decryption_key=hashed_key, doc=doc
+    )
+    logging.debug(f"Extracted {len(annotations)} annotations from the PDF")
 
     if not annotations:
+        doc.close()
         raise ValueError(
             "No annotations found in the PDF. Ensure the document has been properly anonymized."
         )
 
-    doc = pymupdf.open(str(anon_path))
-
+    redacted_pages = set()
     for ann in annotations:
         if "entity" in ann and "page" in ann and "rect" in ann:
             page_num = int(ann["page"]) - 1  # Pages are 0-indexed in PyMuPDF
@@ -107,10 +158,36 @@ def process_anonymized_pdf_to_deanonymize(
 
                     original_text = ann["entity"]
                     page.add_redact_annot(rect, fill=(1, 1, 1), text=original_text)  # type: ignore
-                    page.apply_redactions()  # type: ignore
+                    redacted_pages.add(page_num)
+
+    # Apply all redactions of a page in one content-stream rewrite
+    for page_num in redacted_pages:
+        _apply_text_redactions(doc[page_num])
     return doc
 
 
+# Uploads are copied to disk in chunks of this size instead of read whole
+_UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+
+def _copy_to_path(file: UploadFile, path: Path) -> None:
+    with open(path, "wb") as f:
+        shutil.copyfileobj(file.file, f, length=_UPLOAD_CHUNK_SIZE)
+
+
+async def save_upload(file: UploadFile, path: Path) -> None:
+    """Stream an uploaded file to `path` and close it.
+
+    The upload's spooled temporary file is copied in fixed-size chunks on the
+    threadpool, so the whole PDF is never held in memory at once.
+    """
+    try:
+        await file.seek(0)
+        await run_in_threadpool(_copy_to_path, file, path)
+    finally:
+        await file.close()
+
+
 async def create_temp_paths_and_save(file: UploadFile) -> Tuple[Path, Path]:
     """Create temporary paths for the uploaded file and save its content.
 
@@ -122,11 +199,6 @@ async def create_temp_paths_and_save(file: UploadFile) -> Tuple[Path, Path]:
     Returns:
         Tuple[Path, Path]: A tuple containing the paths to the anonymized and deanonymized files.
     """
-    content = await file.read()
-    await file.close()
-
-    from src.api.config import settings
-
     temp_dir = Path(settings.DATA_DIR) / "temp/deanonymized"
     temp_dir.mkdir(parents=True, exist_ok=True)
 
@@ -134,13 +206,15 @@ async def create_temp_paths_and_save(file: UploadFile) -> Tuple[Path, Path]:
     anon_path = temp_dir / f"{process_id}_anonymized.pdf"
     deanon_path = temp_dir / f"{process_id}_deanonymized.pdf"
 
-    with open(anon_path, "wb") as f:
-        f.write(content)
+    await save_upload(file, anon_path)
     return anon_path, deanon_path
 
 
 async def upload_and_analyze_files(
-    files: list[UploadFile], tags: Optional[list[str]], db: Session
+    files: list[UploadFile],
+    tags: Optional[list[str]],
+    db: Session,
+    analyzer: Optional[ModularTextAnalyzer] = None,
 ) -> list[DocumentDto]:
     """Upload files, analyze them for PII entities, and store metadata in the database.
 
@@ -148,33 +222,35 @@ async def upload_and_analyze_files(
         files (list[UploadFile]): List of files to be uploaded and analyzed.
         tags (list[str]): List of tags to be associated with the documents.
         db (Session): Database session for storing document metadata.
+        analyzer (Optional[ModularTextAnalyzer]): Preloaded analyzer to reuse.
 
     Returns:
         _type_: list[DocumentDto]
     """
     docs: list[DocumentDto] = []
 
+    sources: list[tuple[UploadFile, str, Path]] = []
+    documents: list[list[str]] = []
+    source_dir = Path(settings.DATA_DIR) / "temp/source"
+    source_dir.mkdir(parents=True, exist_ok=True)
     for file in files:
-        content = await file.read()
-        await file.close()
-
         file_id = uuid.uuid4().hex
-        from src.api.config import settings
-
-        source_dir = Path(settings.DATA_DIR) / "temp/source"
-        source_dir.mkdir(parents=True, exist_ok=True)
         source_path = source_dir / f"{file_id}.pdf"
-        with open(source_path, "wb") as f:
-            f.write(content)
-
-        text = extract_text_from_pdf(source_path)
+        await save_upload(file, source_path)
 
-        entities, unique = await extract_unique_entities(text=text)
+        sources.append((file, file_id, source_path))
+        documents.append(await run_in_threadpool(extract_pages_from_pdf, source_path))
 
-        # Convert entities to JSON string for database storage
-        import json
+    # Analyze all pages of all documents in one batch instead of one pipeline
+    # run per file on its full text
+    if analyzer is None:
+        analyzer = await run_in_threadpool(ModularTextAnalyzer.get)
+    batch_entities = (
+        await run_in_threadpool(analyzer.analyze_pages, documents) if documents else []
+    )
 
-        entities_json = json.dumps(entities) if entities else None
+    for (file, file_id, source_path), entities in zip(sources, batch_entities):
+        unique = unique_entities(entities)
 
         db_document = create_document(
             db,
@@ -183,21 +259,22 @@ async def upload_and_analyze_files(
             content_type=file.content_type or "application/pdf",
             source_path=str(source_path),
             anonymized_path=None,
-            pii_entities=entities_json,
+            pii_entities=entities or None,
+            commit=False,
         )
 
         db_tags = []
         for tag_name in tags or []:
             tag_id = uuid.uuid4().hex
-            tag = create_tag(db, tag_id, tag_name, file_id)
+            tag = create_tag(db, tag_id, tag_name, file_id, commit=False)
             db_tags.append(tag)
 
-        db_document._entities = entities
-
+        # All fields are built here from known types; skip per-field validation
         stored_tags = [
-            DocumentTagDto(id=str(tag.id), name=str(tag.name)) for tag in db_tags
+            DocumentTagDto.model_construct(id=str(tag.id), name=str(tag.name))
+            for tag in db_tags
         ]
-        doc_meta = DocumentDto(
+        doc_meta = DocumentDto.model_construct(
             id=file_id,
             filename=str(db_document.filename),
             content_type=str(db_document.content_type),
@@ -207,6 +284,10 @@ async def upload_and_analyze_files(
         )
 
         docs.append(doc_meta)
+
+    # Store all documents and tags of this upload in a single transaction
+    if sources:
+        await commit_session(db)
     return docs
 
 
@@ -215,6 +296,7 @@ def analyze_and_anonymize_document(
     request_body: DocumentAnonymizationRequest,
     doc: database.Document,
     key: str,
+    analyzer: Optional[ModularTextAnalyzer] = None,
 ) -> AnalysisAnonymizationResponse:
     """Analyze a document and anonymize identified PII entities.
 
@@ -227,6 +309,7 @@ def analyze_and_anonymize_document(
         request_body: Request containing the PII entity types to anonymize
         doc: Database document model containing document information
         key: Private key used for encrypting PII entities
+        analyzer: Preloaded analyzer to reuse; the shared one is used when omitted
 
     Returns:
         AnalysisAnonymizationResponse:
@@ -239,21 +322,15 @@ def analyze_and_anonymize_document(
         ValueError: If the anonymization process fails to produce a valid output file
     """
     source_path = doc.source_path
-    analyzer = ModularTextAnalyzer()
 
-    entities = getattr(doc, "_entities", None)
+    # Entities stored at upload; documents without them are analyzed here and
+    # the result is saved with the commit of the anonymization event
+    entities = doc.pii_entities
     if not entities:
-        text = ""
-        try:
-            import pymupdf
-
-            pdf_doc: pymupdf.Document = pymupdf.open(source_path)
-            text = "\n".join(p.get_text() for p in pdf_doc)  # type: ignore
-            pdf_doc.close()
-        except Exception:
-            text = ""
-        entities = analyzer.analyze_text(text) if text else []
-        doc._entities = entities
+        if analyzer is None:
+            analyzer = ModularTextAnalyzer.get()
+        entities = analyze_pdf(Path(source_path), analyzer)
+        doc.pii_entities = entities or None
 
     selected = []
     for e in entities:
@@ -266,8 +343,6 @@ def analyze_and_anonymize_document(
 
     mapping = {e["text"]: e["entity_type"].lower() for e in selected}
 
-    from src.api.config import settings
-
     anonym_dir = Path(settings.DATA_DIR) / "temp/anonymized"
     anonym_dir.mkdir(parents=True, exist_ok=True)
     out_path = anonym_dir / f"{file_id}.pdf"
@@ -314,40 +389,90 @@ def analyze_and_anonymize_document(
     )
 
 
-def extract_text_from_pdf(source_path: Path) -> str:
-    """Extract text from a PDF file using PyMuPDF."""
-    text = ""
+def extract_pages_from_pdf(source_path: Path) -> list[str]:
+    """Extract the text of each page of a PDF file using PyMuPDF."""
     try:
-        doc = pymupdf.open(str(source_path))
-        text = "\n".join(page.get_text() for page in doc)  # type: ignore
-        doc.close()
+        with pymupdf.open(str(source_path)) as doc:
+            return [page.get_text() for page in doc]  # type: ignore
     except Exception:
-        text = ""
-    return text
+        return []
+
+
+def analyze_pdf(source_path: Path, analyzer: ModularTextAnalyzer) -> list[dict]:
+    """Analyze all pages of a PDF file, cached by the file's path, size and mtime.
+
+    Args:
+        source_path (Path): The PDF file to analyze.
+        analyzer (ModularTextAnalyzer): The analyzer to use; part of the cache key.
+
+    Returns:
+        list[dict]: entities as returned by the analyzer; empty if the file
+            cannot be read.
+    """
+    try:
+        stat = os.stat(source_path)
+    except OSError:
+        return []
+    key = (
+        str(source_path),
+        stat.st_mtime_ns,
+        stat.st_size,
+        analyzer.nlp_engine_name,
+        analyzer.model_name,
+    )
+    cached = _pdf_entities_cache.get(key)
+    if cached is not None:
+        return [dict(e) for e in cached]
+
+    pages = extract_pages_from_pdf(source_path)
+    entities = analyzer.analyze_pages([pages])[0] if pages else []
+    _pdf_entities_cache.put(key, tuple(dict(e) for e in entities))
+    return entities
+
+
+def clear_pdf_entities_cache() -> None:
+    """Empty the cache of analyzed PDF files."""
+    _pdf_entities_cache.clear()
+
+
+def extract_text_from_pdf(source_path: Path) -> str:
+    """Extract text from a PDF file using PyMuPDF."""
+    return "\n".join(extract_pages_from_pdf(source_path))
 
 
 async def extract_unique_entities(
     text: str,
+    analyzer: Optional[ModularTextAnalyzer] = None,
 ) -> tuple[list[dict[str, str]], list[dict[str, str]]]:
     """Extract unique entities from the given text using the provided analyzer.
 
     Args:
         text (str): The text to analyze for entities.
+        analyzer (Optional[ModularTextAnalyzer]): Preloaded analyzer to reuse;
+            the shared one is used when omitted.
 
     Returns:
         tuple[list[dict[str, str]], list[dict[str, str]]]: the first list contains all entities found,
             the second list contains unique entities with their types and text.
     """
-    analyzer = ModularTextAnalyzer()
-    entities = analyzer.analyze_text(text) if text else []
-    unique: list[dict[str, str]] = []
-    seen = set()
-    for ent in entities:
-        key = (ent["entity_type"], ent["text"])
-        if key not in seen:
-            unique.append({"entity_type": ent["entity_type"], "text": ent["text"]})
-            seen.add(key)
-    return entities, unique
+    if analyzer is None:
+        analyzer = await run_in_threadpool(ModularTextAnalyzer.get)
+    entities = await run_in_threadpool(analyzer.analyze_text, text) if text else []
+    return entities, unique_entities(entities)
+
+
+def unique_entities(entities: list[dict]) -> list[dict[str, str]]:
+    """Reduce entities to unique (entity_type, text) pairs, keeping their order.
+
+    Args:
+        entities (list[dict]): entities as returned by the analyzer.
+
+    Returns:
+        list[dict[str, str]]: unique entities with their types and text.
+    """
+    # dict.fromkeys dedups in C and keeps the first-seen order
+    keys = dict.fromkeys((ent["entity_type"], ent["text"]) for ent in entities)
+    return [{"entity_type": entity_type, "text": text} for entity_type, text in keys]
 
 
 def anonymize_pdf(
@@ -373,22 +498,34 @@ def anonymize_pdf(
     Returns:
         List[dict]: List of occurrences with metadata about each redaction.
     """
-    hashed_key = hashlib.sha256(private_key.encode()).digest()
+    hashed_key = _derive_key(private_key)
+    # Same for every occurrence; only the GCM nonce must differ per encryption
+    key_fingerprint = _key_fingerprint(private_key)
     masks = {**_DEFAULT_ENTITY_MASK, **(entity_masks or {})}
 
     doc: pymupdf.Document = pymupdf.open(input_path)
     occurrences: List[_Occurrence] = []
     id_counter = 0
+    # Scan the plain text of every page once for all targets, so the costly
+    # layout search only runs on pages that contain the target. Redactions
+    # only remove text, so scanning up front never misses a hit.
+    needles = {target: _normalize_search_text(target) for target in replacements}
+    needle_pages = _pages_per_needle(doc, set(needles.values()))
 
     for target, entity_type in replacements.items():
         mask = masks.get(entity_type, f"[{entity_type.upper()}]")
-        for page_idx, page in enumerate(doc):  # type: ignore
-            page: pymupdf.Page  # type: ignore
+        for page_idx in needle_pages[needles[target]]:
+            page: pymupdf.Page = doc[page_idx]  # type: ignore
             rects = page.search_for(target)
+            if not rects:
+                continue
+            # Parse the page layout once for all matches instead of once per match
+            blocks = _text_blocks(page_idx=page_idx, page=page)
+            redacted = False
             for r in rects:
                 # Get text style information around the target text
                 font_size, font_name = extract_font_details(
-                    page_idx=page_idx, page=page, r=r
+                    page_idx=page_idx, page=page, r=r, blocks=blocks
                 )
 
                 logging.debug(
@@ -406,7 +543,7 @@ def anonymize_pdf(
                     "encrypted_entity": encrypt_entity(
                         data=target.encode("utf-8"), key=hashed_key
                     ),
-                    "key_fingerprint": get_fingerprint(data=private_key),
+                    "key_fingerprint": key_fingerprint,
                 }
                 occurrences.append(occ)
                 id_counter += 1
@@ -418,7 +555,7 @@ def anonymize_pdf(
                         text=mask,
                         fontsize=font_size,
                     )
-                    page.apply_redactions()  # type: ignore
+                    redacted = True
                 except Exception as e:
                     logging.error(
                         f"Failed to add redaction for target='{target.encode('utf-8', errors='replace').decode('ascii', errors='ignore')} on page {page_idx + 1}: {e}"
@@ -431,17 +568,112 @@ def anonymize_pdf(
                         )
                     }' on page {page_idx + 1}."
                 )
+            if redacted:
+                # Rewrite the page content once for all matches of this target
+                _apply_text_redactions(page)
 
+    # Embed the occurrences before saving so the PDF is written only once
+    doc.set_xml_metadata(_occurrences_xmp(occurrences))
     doc.save(output_path, incremental=incremental_save)
-
-    _embed_occurrences_xmp(output_path, occurrences)
+    logging.debug(
+        f"Embedded {len(occurrences)} occurrences in XMP metadata for {output_path}"
+    )
     return occurrences
 
 
+def _apply_text_redactions(page: pymupdf.Page) -> None:  # type: ignore
+    """Apply the page's redaction annotations to its text only.
+
+    The mask text is part of each redaction annotation, so a single
+    content-stream rewrite removes the originals and writes the masks.
+    Images and vector graphics under the white fill are left untouched,
+    which spares MuPDF from re-encoding image pixels per page.
+    """
+    page.apply_redactions(  # type: ignore
+        images=pymupdf.PDF_REDACT_IMAGE_NONE,
+        graphics=pymupdf.PDF_REDACT_LINE_ART_NONE,
+    )
+
+
+def _normalize_search_text(text: str) -> str:
+    """Lowercase *text* and collapse whitespace, like search_for matching does."""
+    return " ".join(text.split()).lower()
+
+
+def _trie_regex(words: Iterable[str]) -> str:
+    """Build a regex matching any of *words*, branching per character like a trie.
+
+    Unlike a plain ``a|b|c`` alternation, the regex engine never retries every
+    word at a position; shared prefixes are matched once. Optional tails are
+    greedy, so at each position the longest word wins.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}  # end of a word
+
+    # Post-order walk with an explicit stack: the trie is as deep as the longest
+    # word, and a recursive build would hit the recursion limit on long targets
+    built: Dict[int, str] = {}
+    stack: List[Tuple[dict, bool]] = [(trie, False)]
+    while stack:
+        node, children_built = stack.pop()
+        if not children_built:
+            stack.append((node, True))
+            stack.extend((child, False) for char, child in node.items() if char)
+            continue
+        branches = [
+            re.escape(char) + built.pop(id(child))
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            built[id(node)] = ""
+            continue
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        built[id(node)] = f"(?:{body})?" if "" in node else body
+    return built[id(trie)]
+
+
+def _pages_per_needle(doc: pymupdf.Document, needles: set[str]) -> Dict[str, List[int]]:
+    """Map each normalized needle to the indexes of the pages containing it.
+
+    Every page text is scanned once with a single trie regex for all needles,
+    instead of one substring search per needle per page. The zero-width
+    lookahead reports the longest needle starting at each position; a needle
+    that only occurs as the start of a longer one is found via that longer hit.
+    """
+    pages: Dict[str, List[int]] = {needle: [] for needle in needles}
+    words = [needle for needle in needles if needle]
+    pattern = re.compile(f"(?=({_trie_regex(words)}))") if words else None
+    for page_idx, page in enumerate(doc):  # type: ignore
+        found: set[str] = set()
+        if pattern is not None:
+            text = _normalize_search_text(page.get_text("text", flags=_SEARCH_FLAGS))
+            found = {m.group(1) for m in pattern.finditer(text)}
+        for needle in needles:
+            if not needle or needle in found or any(needle in hit for hit in found):
+                pages[needle].append(page_idx)
+    return pages
+
+
+def _text_blocks(page_idx: int, page: pymupdf.Page) -> list:  # type: ignore
+    """Return the text blocks of a page, or an empty list if extraction fails."""
+    try:
+        return page.get_text("dict")["blocks"]  # type: ignore
+    except Exception as e:
+        if "font" in str(e):
+            logging.warning(f"Could not determine font for page {page_idx + 1}: {e}")
+        return []  # Fallback to empty list if text extraction fails
+
+
 def extract_font_details(
     page_idx: int,
     page: pymupdf.Page,  # type: ignore
     r: pymupdf.Rect,
+    blocks: Optional[list] = None,
 ) -> Tuple[int, str]:
     """Extract font size and name from the text span at the given rectangle.
 
@@ -449,18 +681,16 @@ def extract_font_details(
         page_idx (int): page index (0-based) in the document.
         page (pymupdf.Page): pymupdf Page object to extract text from.
         r (pymupdf.Rect): pymupdf Rect object representing the area to check.
+        blocks (Optional[list]): text blocks of the page from an earlier
+            ``get_text("dict")`` call; extracted from the page when omitted.
 
     Returns:
         Tuple[int, str]: Tuple containing font size and font name.
     """
     font_size = 11  # Default font size if we can't determine
     font_name = "Helvetica"
-    try:
-        blocks = page.get_text("dict")["blocks"]  # type: ignore
-    except Exception as e:
-        if "font" in str(e):
-            logging.warning(f"Could not determine font for page {page_idx + 1}: {e}")
-        blocks = []  # Fallback to empty list if text extraction fails
+    if blocks is None:
+        blocks = _text_blocks(page_idx=page_idx, page=page)
     for block in blocks:
         for line in block.get("lines", []):
             for span in line.get("spans", []):
@@ -477,13 +707,25 @@ def extract_annotations(
     *,
     decryption_key: Optional[bytes] = None,
     header: bytes = b"header",
+    doc: Optional[pymupdf.Document] = None,
 ) -> List[dict]:
     """Return list of dictionaries parsed from XMP.
 
     If *decryption_key* is supplied, the function will attempt to decrypt the
     ``EncryptedEntity`` field of each record and add ``entity`` (plaintext).
+    If *doc* is an already opened PyMuPDF document of *input_path*, the XMP is
+    read from it instead of opening the file a second time with pikepdf.
     """
     logging.debug(f"Extracting annotations from {input_path}")
+    if doc is not None:
+        xmp_xml = doc.get_xml_metadata()
+        if not xmp_xml:
+            logging.debug("No metadata found in PDF")
+            return []
+        if xmp_xml.startswith("\ufeff"):
+            xmp_xml = xmp_xml[1:]
+        return _annotations_from_xmp(xmp_xml, decryption_key, header)
+
     try:
         with pikepdf.Pdf.open(input_path) as pdf:
             if "/Metadata" not in pdf.Root:
@@ -511,6 +753,12 @@ def extract_annotations(
         logging.error(f"Failed to open PDF or read metadata: {e}")
         return []
 
+    return _annotations_from_xmp(xmp_xml, decryption_key, header)
+
+
+def _annotations_from_xmp(
+    xmp_xml: str, decryption_key: Optional[bytes], header: bytes
+) -> List[dict]:
     # Try multiple extraction methods for maximum compatibility
     occurrences: list[dict] = try_all_extraction_methods(
         decryption_key=decryption_key, header=header, xmp_xml=xmp_xml
@@ -603,18 +851,12 @@ def retrieve_occurrences_xmp_from_cdata(
     Returns:
         List[dict]: A list of occurrences extracted from the XMP XML.
     """
-    cdata_patterns = [
-        r"<custom:AnnotationData><!\[CDATA\[(.*?)\]\]></custom:AnnotationData>",
-        r"<custom:AnnotationData>\s*<!\[CDATA\[(.*?)\]\]>\s*</custom:AnnotationData>",
-        r"<custom:AnnotationData>(.*?)</custom:AnnotationData>",  # Non-CDATA version
-    ]
-
-    for pattern in cdata_patterns:
-        match = re.search(pattern, xmp_xml, re.DOTALL)
+    for pattern in _CDATA_PATTERNS:
+        match = pattern.search(xmp_xml)
         if match:
             json_blob = match.group(1).strip()
             try:
-                data = json.loads(json_blob)
+                data = orjson.loads(json_blob)
                 if isinstance(data, dict) and "occurrences" in data:
                     occurrences: list = data["occurrences"]
                     if occurrences:
@@ -648,7 +890,7 @@ def retrieve_occurrences_xmp_from_cdata(
                             )
                         return occurrences
 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logging.error(f"Failed to parse JSON from pattern match: {e}")
                 blob_preview = json_blob[:100] if json_blob else "empty"
                 logging.debug(f"JSON data preview: {blob_preview}...")
@@ -670,44 +912,41 @@ def retrieve_occurrences_from_xmp_attributes(
     Returns:
         List[dict]: A list of occurrences extracted from the XMP XML.
     """
-    attr_start = xmp_xml.find('custom:AnnotationData="')
-    if attr_start != -1:
-        attr_start += len('custom:AnnotationData="')
-        attr_end = xmp_xml.find('"', attr_start)
-        if attr_end != -1:
-            json_blob = xmp_xml[attr_start:attr_end]
-            # Unescape XML entities
-            unescaped_json = saxutils.unescape(json_blob)
-
-            try:
-                data = json.loads(unescaped_json)
-                if isinstance(data, dict) and "occurrences" in data:
-                    occurrences: list = data["occurrences"]
-                    if occurrences:
-                        logging.debug(
-                            f"Found {len(occurrences)} occurrences using attribute pattern"
-                        )
+    attr_match = _ANNOTATION_ATTR_RE.search(xmp_xml)
+    if attr_match:
+        json_blob = attr_match.group(1)
+        # Unescape XML entities
+        unescaped_json = saxutils.unescape(json_blob)
 
-                        # Process decryption if key is provided
-                        if decryption_key:
-                            for occ in occurrences:
-                                if "encrypted_entity" in occ:
-                                    try:
-                                        plaintext = decrypt_entity(
-                                            occ["encrypted_entity"],
-                                            decryption_key,
-                                            header,
-                                        )
-                                        occ["entity"] = plaintext.decode(
-                                            "utf-8", errors="replace"
-                                        )
-                                    except Exception as e:
-                                        logging.error(f"Failed to decrypt entity: {e}")
-                                        occ["entity"] = None
-                        return occurrences
+        try:
+            data = orjson.loads(unescaped_json)
+            if isinstance(data, dict) and "occurrences" in data:
+                occurrences: list = data["occurrences"]
+                if occurrences:
+                    logging.debug(
+                        f"Found {len(occurrences)} occurrences using attribute pattern"
+                    )
 
-            except json.JSONDecodeError as e:
-                logging.error(f"Failed to parse JSON from attribute: {e}")
+                    # Process decryption if key is provided
+                    if decryption_key:
+                        for occ in occurrences:
+                            if "encrypted_entity" in occ:
+                                try:
+                                    plaintext = decrypt_entity(
+                                        occ["encrypted_entity"],
+                                        decryption_key,
+                                        header,
+                                    )
+                                    occ["entity"] = plaintext.decode(
+                                        "utf-8", errors="replace"
+                                    )
+                                except Exception as e:
+                                    logging.error(f"Failed to decrypt entity: {e}")
+                                    occ["entity"] = None
+                    return occurrences
+
+        except orjson.JSONDecodeError as e:
+            logging.error(f"Failed to parse JSON from attribute: {e}")
     return []  # No occurrences found with this method
 
 
@@ -724,13 +963,12 @@ def retrieve_custom_properties_from_xmp(
     Returns:
         List[dict]: A list of dictionaries containing custom properties extracted from the XMP XML.
     """
-    tag_re = re.compile(r"<rdf:Description([^>]*)/>", re.DOTALL)
-    prop_re = re.compile(r"custom:([A-Za-z]+)=\"([^\"]*)\"")
-
     annotations: List[dict] = []
-    for m in tag_re.finditer(xmp_xml):
+    for m in _DESCRIPTION_TAG_RE.finditer(xmp_xml):
         attrs_block = m.group(1)
-        props = {k: saxutils.unescape(v) for k, v in prop_re.findall(attrs_block)}
+        props = {
+            k: saxutils.unescape(v) for k, v in _CUSTOM_PROP_RE.findall(attrs_block)
+        }
         if props:  # Only add if we found properties
             if decryption_key and "encrypted_entity" in props:
                 try:
@@ -757,13 +995,12 @@ def retrieve_json_occurrencesfrom_xmp(
     Returns:
         List[dict]: A list of occurrences extracted from the XMP XML.
     """
-    json_pattern = r'\{"occurrences":\s*\[(.*?)\]\}'
-    match = re.search(json_pattern, xmp_xml, re.DOTALL)
+    match = _OCCURRENCES_JSON_RE.search(xmp_xml)
     if match:
         try:
             # Reconstruct the full JSON string
             json_blob = f'{{"occurrences": [{match.group(1)}]}}'
-            data = json.loads(json_blob)
+            data = orjson.loads(json_blob)
             occurrences: list = data.get("occurrences", [])
             if occurrences:
                 logging.debug(
@@ -785,17 +1022,14 @@ def retrieve_json_occurrencesfrom_xmp(
                                 logging.error(f"Failed to decrypt entity: {e}")
                                 occ["entity"] = None
                 return occurrences
-        except (json.JSONDecodeError, Exception) as e:
+        except (orjson.JSONDecodeError, Exception) as e:
             logging.error(f"Failed to parse JSON from pattern search: {e}")
 
     return []  # No valid occurrences found
 
 
-def _embed_occurrences_xmp(pdf_path: str, occs: List[_Occurrence]) -> None:
-    """Create /Metadata with one <rdf:Description> element per occurrence."""
-    # Convert occurrences to JSON for embedding in CDATA section
-    import json
-
+def _occurrences_xmp(occs: List[_Occurrence]) -> str:
+    """Build the XMP packet holding all occurrences as JSON in a CDATA section."""
     # Format the occurrences into a proper dictionary
     # Make sure to convert all values to standard Python types
     safe_occs = []
@@ -814,8 +1048,10 @@ def _embed_occurrences_xmp(pdf_path: str, occs: List[_Occurrence]) -> None:
 
     occurrences_dict = {"occurrences": safe_occs}
 
-    # Convert to JSON string - ensure ASCII encoding to avoid Unicode issues
-    json_blob = json.dumps(occurrences_dict, ensure_ascii=True)
+    # orjson writes compact JSON, which keeps the payload small for documents
+    # with many occurrences. All fields are ASCII (base64, hex, masks), so the
+    # UTF-8 output equals what ensure_ascii would give.
+    json_blob = orjson.dumps(occurrences_dict).decode()
 
     # Use a standard packet ID as seen in the working example
     xmp = f"""<?xpacket begin='' id='W5M0MpCehiHzreSzNTczkc9d'?>
@@ -829,22 +1065,7 @@ def _embed_occurrences_xmp(pdf_path: str, occs: List[_Occurrence]) -> None:
 
     # Debug output to help diagnose any issues
     logging.debug(f"XMP metadata preview (first 200 chars): {xmp[:200]}...")
-
-    # First clear any existing metadata to avoid conflicts
-    try:
-        # Try to open and clean up the PDF before adding new metadata
-        with pikepdf.Pdf.open(pdf_path, allow_overwriting_input=True) as pdf:
-            # Create a clean XMP metadata object
-            pdf.Root.Metadata = pdf.make_stream(xmp.encode("utf-8"))
-            # Save without any additional options
-            pdf.save(pdf_path)
-            logging.debug(
-                f"Embedded {len(occs)} occurrences in XMP metadata for {pdf_path}"
-            )
-    except Exception as e:
-        logging.error(f"Failed to embed XMP metadata: {e}")
-        # Print the first part of the XMP for debugging
-        logging.error(f"XMP content preview: {xmp[:500]}...")
+    return xmp
 
 
 if __name__ == "__main__":
@@ -0,0 +1,18 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+# Numpy-getallen (scores van transformers) en niet-string dict-keys mogen mee
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+class OrjsonResponse(JSONResponse):
+    """JSON-response die met orjson serialiseert.
+
+    Vervangt FastAPI's `ORJSONResponse`, die in nieuwere FastAPI-versies
+    deprecated is en bij elke response een waarschuwing geeft.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=_ORJSON_OPTIONS)
@@ -6,7 +6,7 @@ from src.api.services.text_analyzer import ModularTextAnalyzer
 
 def test_analyze_text_person_and_email():
     """Test of de analyzer zowel PERSON als EMAIL entiteiten kan vinden in een voorbeeldzin."""
-    analyzer = ModularTextAnalyzer()
+    analyzer = ModularTextAnalyzer.get()
     text = "Mijn naam is Mark Rutte en mijn email is test@example.com."
     entities = ["PERSON", "EMAIL"]
     results = analyzer.analyze_text(text, entities)
@@ -111,6 +111,38 @@ class TestAnalyzeEndpoint:
         assert response.status_code == 422  # Validation error
 
 
+class TestAnalyzeBatchEndpoint:
+    """Test the /api/v1/analyze/batch endpoint."""
+
+    def test_analyze_batch_matches_single(self):
+        """Test that batch results line up with per-text /analyze results."""
+        texts = ["Jan de Vries woont in Amsterdam", "Mail naar jan@example.com"]
+        response = CLIENT.post(
+            f"{BASE_URL}/api/v1/analyze/batch", json={"texts": texts, "language": "nl"}
+        )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert len(results) == len(texts)
+
+        for text, result in zip(texts, results):
+            single = CLIENT.post(
+                f"{BASE_URL}/api/v1/analyze", json={"text": text, "language": "nl"}
+            ).json()
+            assert result["text_length"] == len(text)
+            assert sorted(
+                (e["entity_type"], e["start"], e["end"]) for e in result["pii_entities"]
+            ) == sorted(
+                (e["entity_type"], e["start"], e["end"]) for e in single["pii_entities"]
+            )
+
+    def test_analyze_batch_empty_validation(self):
+        """Test that an empty batch is rejected."""
+        response = CLIENT.post(f"{BASE_URL}/api/v1/analyze/batch", json={"texts": []})
+
+        assert response.status_code == 422  # Validation error
+
+
 class TestAnonymizeEndpoint:
     """Test the new /api/v1/anonymize endpoint."""
 
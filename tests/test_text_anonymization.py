@@ -0,0 +1,255 @@
+import re
+
+import pymupdf
+import pytest
+from presidio_analyzer import RecognizerResult
+
+from src.api.services.text_analyzer import (
+    ModularTextAnalyzer,
+    chunk_text,
+    replace_entities,
+)
+from src.api.utils.patterns import (
+    DutchBSNRecognizer,
+    DutchDateRecognizer,
+    DutchDriversLicenseRecognizer,
+    DutchIBANRecognizer,
+    DutchPassportIdRecognizer,
+    DutchPhoneNumberRecognizer,
+    EmailRecognizer,
+    MultiPatternRecognizer,
+)
+from src.api.utils.pdf_xmp import (
+    _normalize_search_text,
+    _pages_per_needle,
+    _trie_regex,
+)
+
+
+@pytest.mark.unit
+def test_replace_entities_single_pass() -> None:
+    text = "Jan woont in Amsterdam."
+    results = [
+        {"entity_type": "LOCATION", "start": 13, "end": 22, "score": ""},
+        {"entity_type": "PERSON", "start": 0, "end": 3, "score": ""},
+    ]
+
+    assert replace_entities(text, results) == "<PERSON> woont in <LOCATION>."
+
+
+@pytest.mark.unit
+def test_replace_entities_overlap_keeps_highest_score() -> None:
+    text = "Bel 0612345678 nu"
+    results = [
+        {"entity_type": "DATE_TIME", "start": 4, "end": 10, "score": 0.3},
+        {"entity_type": "PHONE_NUMBER", "start": 4, "end": 14, "score": 0.7},
+    ]
+
+    assert replace_entities(text, results) == "Bel <PHONE_NUMBER> nu"
+
+
+@pytest.mark.unit
+def test_replace_entities_without_results() -> None:
+    assert replace_entities("geen PII", []) == "geen PII"
+
+
+@pytest.mark.unit
+def test_chunk_text_offsets_cover_text() -> None:
+    text = "Eerste alinea over Jan.\n\nTweede alinea. Met twee zinnen in Utrecht."
+    chunks = list(chunk_text(text, max_chars=30))
+
+    assert all(len(chunk) <= 30 for _, chunk in chunks)
+    assert "".join(chunk for _, chunk in chunks) == text
+    for offset, chunk in chunks:
+        assert text[offset : offset + len(chunk)] == chunk
+    assert chunks[0][1] == "Eerste alinea over Jan.\n\n"
+
+
+@pytest.mark.unit
+def test_merge_results_keeps_highest_score_per_span() -> None:
+    text = "Mail jan@example.nl"
+    nlp_results = [
+        {"entity_type": "EMAIL", "start": 5, "end": 19, "score": 0.4, "text": "x"},
+        {"entity_type": "PERSON", "start": 5, "end": 8, "score": "", "text": "jan"},
+    ]
+    pattern_results = [
+        RecognizerResult("EMAIL", 5, 19, 0.6),
+        RecognizerResult("EMAIL", 5, 19, 0.5),
+    ]
+
+    results = ModularTextAnalyzer._merge_results(
+        text, nlp_results, pattern_results, None
+    )
+
+    assert results == [
+        {
+            "entity_type": "EMAIL",
+            "start": 5,
+            "end": 19,
+            "score": 0.6,
+            "text": "jan@example.nl",
+        },
+        {"entity_type": "PERSON", "start": 5, "end": 8, "score": "", "text": "jan"},
+    ]
+
+
+@pytest.mark.unit
+def test_multi_pattern_recognizer_scans_all_patterns_at_once() -> None:
+    text = "BSN 123456782, rijbewijs 1234567890, tel 0612345678, jan@example.nl"
+    recognizer = MultiPatternRecognizer(
+        [
+            EmailRecognizer(),
+            DutchPhoneNumberRecognizer(),
+            DutchBSNRecognizer(),
+            DutchDriversLicenseRecognizer(),
+        ]
+    )
+
+    found = [
+        (r.entity_type, text[r.start : r.end])
+        for r in recognizer.analyze(text, entities=[])
+    ]
+
+    assert found == [
+        ("BSN", "123456782"),
+        ("DRIVERS_LICENSE", "1234567890"),
+        ("PHONE_NUMBER", "0612345678"),
+        ("EMAIL", "jan@example.nl"),
+    ]
+
+
+@pytest.mark.unit
+def test_multi_pattern_recognizer_prefers_highest_scoring_pattern() -> None:
+    text = "Paspoort AB1234567 afgegeven op 1 september 2020"
+    recognizer = MultiPatternRecognizer(
+        [DutchPassportIdRecognizer(), DutchDateRecognizer()]
+    )
+
+    found = [
+        (r.entity_type, text[r.start : r.end], r.score)
+        for r in recognizer.analyze(text, entities=[])
+    ]
+
+    assert found == [
+        ("ID_NO", "AB1234567", 0.6),
+        ("DATE_TIME", "1 september 2020", 0.5),
+    ]
+
+
+@pytest.mark.unit
+def test_bsn_elfproef() -> None:
+    recognizer = DutchBSNRecognizer()
+
+    assert recognizer._is_valid_bsn("111222333")
+    assert recognizer._is_valid_bsn("123-456-782")
+    assert not recognizer._is_valid_bsn("123456789")
+    assert not recognizer._is_valid_bsn("12345678")
+
+
+@pytest.mark.unit
+def test_bsn_recognizer_rejects_invalid_elfproef() -> None:
+    text = "Geldig BSN 111222333, ongeldig BSN 123456789"
+    results = DutchBSNRecognizer().analyze(text, ["BSN"])
+
+    assert [text[r.start : r.end] for r in results] == ["111222333"]
+
+
+@pytest.mark.unit
+def test_multi_pattern_recognizer_skips_entities_without_required_literal() -> None:
+    recognizer = MultiPatternRecognizer(
+        [EmailRecognizer(), DutchPhoneNumberRecognizer()],
+        required_literals={"EMAIL": "@"},
+    )
+
+    assert [r.entity_type for r in recognizer.analyze("bel 0612345678", [])] == [
+        "PHONE_NUMBER"
+    ]
+    assert [r.entity_type for r in recognizer.analyze("mail a@b.nl", [])] == ["EMAIL"]
+
+
+@pytest.mark.unit
+def test_iban_recognizer_rejects_invalid_checksum() -> None:
+    text = "Geldig NL91 ABNA 0417 1643 00, ongeldig NL92ABNA0417164300"
+    results = DutchIBANRecognizer().analyze(text, ["IBAN"])
+
+    assert [text[r.start : r.end] for r in results] == ["NL91 ABNA 0417 1643 00"]
+
+
+@pytest.mark.unit
+def test_multi_pattern_recognizer_invalid_iban_still_consumes_its_span() -> None:
+    text = "Rekening NL92 ABNA 0417 1643 00, bel 0612345678"
+    recognizer = MultiPatternRecognizer(
+        [DutchIBANRecognizer(), DutchPhoneNumberRecognizer(), DutchDateRecognizer()]
+    )
+
+    # On its own the phone pattern matches the digits inside the invalid IBAN
+    assert "0417 1643 00" in [
+        text[r.start : r.end].strip()
+        for r in DutchPhoneNumberRecognizer().analyze(text, ["PHONE_NUMBER"])
+    ]
+    assert [
+        (r.entity_type, text[r.start : r.end])
+        for r in recognizer.analyze(text, entities=[])
+    ] == [("PHONE_NUMBER", "0612345678")]
+
+
+def _pdf_with_pages(*texts: str) -> pymupdf.Document:
+    doc = pymupdf.open()
+    for text in texts:
+        doc.new_page().insert_text((72, 72), text)
+    return doc
+
+
+@pytest.mark.unit
+def test_trie_regex_prefers_longest_word() -> None:
+    pattern = re.compile(_trie_regex(["jan", "jansen", "janssen", "piet"]))
+
+    assert pattern.match("jansen").group() == "jansen"
+    assert pattern.match("janssens").group() == "janssen"
+    assert pattern.match("jansma").group() == "jan"
+    assert pattern.match("pie") is None
+
+
+@pytest.mark.unit
+def test_trie_regex_handles_very_long_words() -> None:
+    word = "x" * 20000
+
+    assert re.fullmatch(_trie_regex([word, "xy"]), word)
+
+
+@pytest.mark.unit
+def test_pages_per_needle_finds_prefix_needles() -> None:
+    doc = _pdf_with_pages("Jan Jansen woont hier", "Alleen Jansen", "Jan alleen")
+
+    pages = _pages_per_needle(doc, {"jan", "jansen"})
+
+    assert pages == {"jan": [0, 1, 2], "jansen": [0, 1]}
+
+
+@pytest.mark.unit
+def test_pages_per_needle_finds_overlapping_needles() -> None:
+    doc = _pdf_with_pages("de vries en zonen", "vries", "zonen")
+
+    pages = _pages_per_needle(doc, {"de vries", "vries en", "ies en zo", "nen"})
+
+    assert pages == {
+        "de vries": [0],
+        "vries en": [0],
+        "ies en zo": [0],
+        "nen": [0, 2],
+    }
+
+
+@pytest.mark.unit
+def test_pages_per_needle_matches_search_for() -> None:
+    doc = _pdf_with_pages("JAN DE VRIES", "Jan  de   Vries", "jan de", "Vries Jan")
+    targets = ["Jan de Vries", "jan  DE\nvries", "vries jan", "Piet"]
+    needles = {target: _normalize_search_text(target) for target in targets}
+
+    pages = _pages_per_needle(doc, set(needles.values()))
+
+    for target, needle in needles.items():
+        assert pages[needle] == [
+            page_idx for page_idx, page in enumerate(doc) if page.search_for(needle)
+        ], target
+    assert pages[needles["Jan de Vries"]] == [0, 1]